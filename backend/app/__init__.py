@@ -2,42 +2,113 @@
 Application factory pattern for Flask
 This module provides functions to initialize and configure the Flask application
 """
-from flask import Flask, jsonify, make_response
-from flask_restful import Api
+from flask import Flask, Response, current_app
 # CORS is now handled by our custom middleware, not Flask-CORS
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
+import queue
 from config import Config
 from celery import Celery
 
 def make_celery(app):
-    """Create and configure Celery instance"""
+    """Create and configure Celery instance, reusing the one already bound to app"""
+    if 'celery' in app.extensions:
+        return app.extensions['celery']
+
     celery = Celery(
         app.import_name,
         backend=app.config.get('result_backend', 'redis://localhost:6379/0'),
         broker=app.config.get('broker_url', 'redis://localhost:6379/0')
     )
     celery.conf.update(app.config)
+
+    # Reuse a bounded pool of Redis connections instead of opening new ones per publish
+    max_connections = app.config.get('CELERY_REDIS_POOL_SIZE', 20)
+    redis_transport_options = {
+        'max_connections': max_connections,
+        'socket_keepalive': True,
+        'health_check_interval': app.config.get('CELERY_REDIS_HEALTH_CHECK_INTERVAL', 30),
+        'retry_on_timeout': True,
+    }
+    broker_transport_options = dict(
+        redis_transport_options,
+        visibility_timeout=app.config.get('CELERY_VISIBILITY_TIMEOUT', 3600),
+    )
+    celery.conf.update(
+        broker_pool_limit=app.config.get('CELERY_BROKER_POOL_LIMIT', 10),
+        broker_transport_options=broker_transport_options,
+        redis_max_connections=max_connections,
+        result_backend_transport_options={
+            'max_connections': max_connections,
+            'global_keyprefix': app.config.get('CELERY_RESULT_KEY_PREFIX', ''),
+        },
+        broker_connection_retry_on_startup=True,
+        task_ignore_result=app.config.get('CELERY_TASK_IGNORE_RESULT', True),
+        result_expires=app.config.get('CELERY_RESULT_EXPIRES', 3600),
+        worker_pool=app.config.get('CELERY_POOL', Config.CELERY_POOL),
+        worker_concurrency=app.config.get('CELERY_CONCURRENCY'),
+        worker_prefetch_multiplier=app.config.get('CELERY_PREFETCH_MULTIPLIER', 1),
+        task_acks_late=app.config.get('CELERY_TASK_ACKS_LATE', True),
+    )
     
     class ContextTask(celery.Task):
         """Make celery tasks work with Flask app context."""
+        # Tasks that never touch Flask can pass needs_app_context=False to skip it entirely
+        needs_app_context = True
+        _app_context = staticmethod(app.app_context)
+
         def __call__(self, *args, **kwargs):
-            with app.app_context():
-                return self.run(*args, **kwargs)
+            run = self.run
+            if not self.needs_app_context:
+                return run(*args, **kwargs)
+            with self._app_context():
+                return run(*args, **kwargs)
                 
     celery.Task = ContextTask
+
+    app.extensions['celery'] = celery
     return celery
 
-# Initialize Celery (will be configured in create_app)
-celery = None
+def get_celery():
+    """Return the Celery instance bound to the current Flask app"""
+    return current_app.extensions['celery']
+
+# Static error payloads, serialized once instead of per error
+_NOT_FOUND_BODY = b'{"error":"Not found"}'
+
+# Log directories already created, so repeated create_app() calls skip the check
+_log_dirs_ready = set()
+
+# Queue handler and listener of the most recently created app's file log
+_log_listener = None
+
+def _restart_log_listener_after_fork():
+    """
+    The listener thread does not survive a fork (gunicorn preload_app), so give
+    each worker its own queue and listener thread for the app it will serve
+    """
+    if _log_listener is None:
+        return
+    queue_handler, listener = _log_listener
+    worker_queue = queue.Queue(-1)
+    queue_handler.queue = worker_queue
+    listener.queue = worker_queue
+    listener.start()
+
+# Registered once: an at-fork hook can never be unregistered, so one per create_app()
+# would pile up and restart the listeners of every app ever created
+os.register_at_fork(after_in_child=_restart_log_listener_after_fork)
 
 def create_app(config_class=Config):
     """Creates and configures the Flask application"""
-    global celery
-    
     app = Flask(__name__)
     app.config.from_object(config_class)
+
+    # Encode jsonify() responses with orjson
+    from app.json_provider import OrjsonProvider
+    app.json = OrjsonProvider(app)
     
     # Configure CORS using our custom middleware
     from app.api.cors_middleware import configure_cors
@@ -47,6 +118,10 @@ def create_app(config_class=Config):
 
     # Configure Celery
     celery = make_celery(app)
+
+    # Register the Celery tasks (shared_task binds them to the app created above)
+    if app.config.get('LOAD_TASKS', True):
+        from app import tasks  # noqa: F401
     
     # Register API blueprint
     from app.api import bp as api_bp
@@ -55,20 +130,31 @@ def create_app(config_class=Config):
     # Register error handlers
     @app.errorhandler(404)
     def not_found(error):
-        return make_response(jsonify({"error": "Not found"}), 404)    # Configure logging
+        return Response(_NOT_FOUND_BODY, status=404, mimetype='application/json')
+
+    # Configure logging
     if not app.debug and not app.testing:
-        if not os.path.exists('logs'):
-            os.mkdir('logs')
-        file_handler = RotatingFileHandler('logs/ibov_api.log', maxBytes=10240, backupCount=10)
+        log_dir = app.config.get('LOG_DIR', 'logs')
+        if log_dir not in _log_dirs_ready:
+            os.makedirs(log_dir, exist_ok=True)
+            _log_dirs_ready.add(log_dir)
+        file_handler = RotatingFileHandler(os.path.join(log_dir, 'ibov_api.log'), maxBytes=10 * 1024 * 1024, backupCount=10)
         file_handler.setFormatter(logging.Formatter(
             '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'))
         file_handler.setLevel(logging.INFO)
-        app.logger.addHandler(file_handler)
+
+        # Request threads only enqueue records; a background listener owns the file I/O
+        log_queue = queue.Queue(-1)
+        queue_handler = QueueHandler(log_queue)
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+
+        global _log_listener
+        _log_listener = (queue_handler, listener)
+        app.logger.addHandler(queue_handler)
 
         app.logger.setLevel(logging.INFO)
         app.logger.info('Zomma Quant API startup')
 
     return app, celery  # Return both app and celery
-
-# Import tasks at the end to avoid circular imports
-from app import tasks
\ No newline at end of file
@@ -1,12 +1,13 @@
-from flask import Blueprint, make_response, jsonify
-from flask_restful import Api
-from .routes import *
+import hashlib
+import json
+from importlib import import_module
+from flask import Blueprint, Response, request
 
 bp = Blueprint('api', __name__)
-api = Api(bp)
 
-def index():
-    return make_response(jsonify({
+# The endpoint catalog never changes at runtime, so serialize it once at import
+# time and hand out the same bytes on every hit of the index route
+_INDEX_BODY = json.dumps({
         "message": "Welcome to the Zomma Quant API",
         "endpoints": [  
             '/api/rrg',  # RRG (Relative Rotation Graph) endpoint
@@ -90,24 +91,74 @@ def index():
             'GET /api/dividend-calendar?limit=50',  # Limit number of results
             'GET /api/dividend-calendar?codigo=PETR4&include_summary=true'  # Include summary statistics
         ]
-    }), 200)
+    }, separators=(',', ':')).encode('utf-8')
+
+# Strong validator for the catalog; it only changes with a deploy
+_INDEX_ETAG = hashlib.md5(_INDEX_BODY).hexdigest()
+_INDEX_HEADERS = {
+    'ETag': f'"{_INDEX_ETAG}"',
+    'Cache-Control': 'public, max-age=3600, immutable',
+}
+
+def index():
+    if request.if_none_match.contains(_INDEX_ETAG):
+        return Response(status=304, headers=_INDEX_HEADERS)
+    return Response(_INDEX_BODY, status=200, mimetype='application/json', headers=_INDEX_HEADERS)
 
 # Import the Config class directly
 from config import Config
 
-# Get API paths from config
-api_paths = Config.API_PATHS if hasattr(Config, 'API_PATHS') else {}
+# Default API paths, overridden by any paths set in config
+_DEFAULT_PATHS = {
+    'rrg': '/rrg',
+    'br_recommendations': '/br-recommendations',
+    'screener_rsi': '/screener-rsi',
+    'volatility_surface': '/volatility-surface',
+    'collar': '/collar',
+    'covered_call': '/covered-call',
+    'pairs_trading': '/pairs-trading',
+    'ibov_stocks': '/ibov-stocks',
+    'cumulative_performance': '/cumulative-performance',
+    'fluxo_ddm': '/fluxo-ddm',
+    'dividend_calendar': '/dividend-calendar',
+}
+api_paths = {**_DEFAULT_PATHS, **getattr(Config, 'API_PATHS', {})}
+
+# Resource views resolved on first use, keyed by dotted class path
+_resolved_views = {}
+
+def _lazy(cls_path):
+    """
+    Return a view function that imports the Resource behind cls_path on the
+    first request, keeping routes.py (and the pandas/statsmodels/yfinance
+    imports it pulls in) out of the worker boot path
+    """
+    def view(*args, **kwargs):
+        resolved = _resolved_views.get(cls_path)
+        if resolved is None:
+            module_name, cls_name = cls_path.rsplit('.', 1)
+            resource = getattr(import_module(module_name), cls_name)
+            resolved = _resolved_views[cls_path] = resource.as_view(cls_name.lower())
+        return resolved(*args, **kwargs)
+    return view
+
+# (API_PATHS key, Resource class) for every data endpoint
+_ROUTES = (
+    ('rrg', 'app.api.routes.RRGDataResource'),
+    ('br_recommendations', 'app.api.routes.BrRecommendationsResource'),
+    ('screener_rsi', 'app.api.routes.ScreenerRSIResource'),
+    ('volatility_surface', 'app.api.routes.VolatilitySurfaceResource'),
+    ('collar', 'app.api.routes.CollarResource'),
+    ('covered_call', 'app.api.routes.CoveredCallResource'),
+    ('pairs_trading', 'app.api.routes.PairsTradingResource'),
+    ('ibov_stocks', 'app.api.routes.IBOVStocksResource'),
+    ('cumulative_performance', 'app.api.routes.CumulativePerformanceResource'),
+    ('fluxo_ddm', 'app.api.routes.FluxoDDMResource'),
+    ('dividend_calendar', 'app.api.routes.DividendCalendarResource'),
+)
 
 # Register resources using config paths
-api.add_resource(RRGDataResource, api_paths.get('rrg', '/rrg'))
-api.add_resource(BrRecommendationsResource, api_paths.get('br_recommendations', '/br-recommendations'))
-api.add_resource(ScreenerRSIResource, api_paths.get('screener_rsi', '/screener-rsi'))
-api.add_resource(VolatilitySurfaceResource, api_paths.get('volatility_surface', '/volatility-surface'))
-api.add_resource(CollarResource, api_paths.get('collar', '/collar'))
-api.add_resource(CoveredCallResource, api_paths.get('covered_call', '/covered-call'))
-api.add_resource(PairsTradingResource, api_paths.get('pairs_trading', '/pairs-trading'))
-api.add_resource(IBOVStocksResource, api_paths.get('ibov_stocks', '/ibov-stocks'))
-api.add_resource(CumulativePerformanceResource, api_paths.get('cumulative_performance', '/cumulative-performance'))
-api.add_resource(FluxoDDMResource, api_paths.get('fluxo_ddm', '/fluxo-ddm'))
-api.add_resource(DividendCalendarResource, api_paths.get('dividend_calendar', '/dividend-calendar'))
+for key, cls_path in _ROUTES:
+    endpoint = cls_path.rsplit('.', 1)[1].lower()
+    bp.add_url_rule(api_paths[key], endpoint, _lazy(cls_path))
 bp.add_url_rule('/', 'index', index)
\ No newline at end of file
@@ -2,42 +2,90 @@
 CORS middleware for the Flask application
 Handles Cross-Origin Resource Sharing settings
 """
-from flask import request, current_app
+import re
+
+DEFAULT_ALLOWED_ORIGINS = ('http://localhost:3000', 'https://zommaquant.com.br')
+
+# Headers that are identical on every response, built once at import
+_PREFLIGHT_HEADERS = (
+    ('Content-Type', 'text/plain; charset=utf-8'),
+    ('Content-Length', '0'),
+)
+_STATIC_CORS_HEADERS = (
+    ('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS'),
+    ('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-Requested-With'),
+    ('Access-Control-Allow-Credentials', 'true'),
+    ('Access-Control-Max-Age', '3600'),  # Cache preflight requests for 1 hour
+)
+
+
+class CORSMiddleware:
+    """
+    WSGI middleware wrapped around ``app.wsgi_app``
+
+    Pre-flight OPTIONS requests are answered here without dispatching into
+    Flask at all. Every other request is passed straight through in
+    production, since Nginx is already setting the CORS headers there; the
+    headers are only added by Flask when the app runs in debug mode.
+    """
+
+    def __init__(self, wsgi_app, app, allowed_origins):
+        self.wsgi_app = wsgi_app
+        # Keep a handle on the Flask app rather than a debug flag captured at
+        # construction time: run.py only switches debug on in app.run()
+        self.app = app
+        self.origin_pattern = compile_origin_pattern(allowed_origins)
+
+    def __call__(self, environ, start_response):
+        # Handle OPTIONS pre-flight requests without touching Flask
+        if environ.get('REQUEST_METHOD') == 'OPTIONS':
+            if self.app.debug:
+                start_response('200 OK', [*_PREFLIGHT_HEADERS, *self._cors_headers(environ)])
+            else:
+                start_response('200 OK', list(_PREFLIGHT_HEADERS))
+            return [b'']
+
+        # Let Nginx handle the CORS headers in production
+        if not self.app.debug:
+            return self.wsgi_app(environ, start_response)
+
+        def cors_start_response(status, headers, exc_info=None):
+            if not any(name.lower() == 'access-control-allow-origin' for name, _ in headers):
+                headers = list(headers) + self._cors_headers(environ)
+            return start_response(status, headers, exc_info)
+
+        return self.wsgi_app(environ, cors_start_response)
+
+    def _cors_headers(self, environ):
+        """Build the CORS headers for development without Nginx"""
+        origin = environ.get('HTTP_ORIGIN')
+
+        # In debug mode, be permissive for local development
+        allow_origin = origin if origin and self.origin_pattern.fullmatch(origin) else '*'
+
+        return [('Access-Control-Allow-Origin', allow_origin), *_STATIC_CORS_HEADERS]
+
+
+def compile_origin_pattern(origins):
+    """
+    Compile the allowed origins into a single regex
+
+    Entries may use ``*`` as a wildcard for one subdomain label, e.g.
+    ``https://*.zommaquant.com.br``
+    """
+    alternatives = (re.escape(origin).replace(r'\*', r'[^./]+') for origin in origins)
+    return re.compile('(?:' + '|'.join(alternatives) + ')')
+
 
 def configure_cors(app):
     """
     Configure CORS settings for the Flask application
-    
+
     This implementation is designed to work with Nginx which is already
     setting the CORS headers. Flask will not duplicate the headers but
     will handle any CORS logic not covered by Nginx.
     """
-    @app.after_request
-    def handle_cors(response):
-        # Handle OPTIONS pre-flight requests properly
-        if request.method == 'OPTIONS':
-            response.status_code = 200
-            # Let Nginx handle the CORS headers
-            return response
-            
-        # Check if we're in a development environment without Nginx
-        if app.debug and 'Access-Control-Allow-Origin' not in response.headers:
-            # Get allowed origins from config
-            allowed_origins = current_app.config.get('ALLOWED_ORIGINS', ['http://localhost:3000', 'https://zommaquant.com.br'])
-            origin = request.headers.get('Origin')
-            
-            # For development without Nginx, set CORS headers
-            if origin in allowed_origins:
-                response.headers['Access-Control-Allow-Origin'] = origin
-            else:
-                # In debug mode, be permissive for local development
-                response.headers['Access-Control-Allow-Origin'] = '*'
-                
-            response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, OPTIONS'
-            response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, X-Requested-With'
-            response.headers['Access-Control-Allow-Credentials'] = 'true'
-            response.headers['Access-Control-Max-Age'] = '3600'  # Cache preflight requests for 1 hour
-        
-        return response
-        
+    allowed_origins = app.config.get('ALLOWED_ORIGINS', DEFAULT_ALLOWED_ORIGINS)
+    app.wsgi_app = CORSMiddleware(app.wsgi_app, app, allowed_origins)
+
     return app
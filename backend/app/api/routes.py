@@ -1,15 +1,23 @@
-from flask_restful import Resource, reqparse
+from flask.views import MethodView
 # from flask_cors import cross_origin  # Removed - using custom CORS middleware
+import functools
+import hashlib
+import heapq
 import json
+import mmap
+from collections import Counter, OrderedDict
 import os
 import math
-from datetime import datetime, timedelta
-import traceback
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+import threading
 import pandas as pd
 import numpy as np  
+import orjson
 from flask import jsonify, current_app, request, make_response
 from ..utils import *
-from ..utils.all_BR_recommendations import analyze_ibovlist, analyze_buy, analyze_strongbuy
+from ..utils.all_BR_recommendations import analyze_ibovlist, analyze_buy, analyze_strongbuy, analyze_all
 from ..utils.cointegration_stocks import get_cointegration_data, get_pair_trading_signals, get_pair_details, get_recent_trading_signals
 from ..utils.collar import get_collar_analysis
 from ..utils.ddm_fluxo import get_fluxo_ddm_data
@@ -21,21 +29,391 @@ from ..utils.archive.dividend_calendar_utils import (
     get_upcoming_dividends
 )
 
+# Export files are resolved once at import instead of on every request
+EXPORT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils", "export")
+RRG_DATA_PATH = os.path.join(EXPORT_DIR, "rrg_data.json")
+BR_RECOMMENDATIONS_PATH = os.path.join(EXPORT_DIR, "all_BR_recommendations.json")
+RSI_SCREENER_PATH = os.path.join(EXPORT_DIR, "screener_overbought_oversold_rsi_results.json")
+VOLATILITY_SURFACE_PATH = os.path.join(EXPORT_DIR, "volatility_surface.json")
+COLLAR_PATH = os.path.join(EXPORT_DIR, "collar_organized.json")
+COVERED_CALL_PATH = os.path.join(EXPORT_DIR, "covered_calls_organized.json")
+COINTEGRATION_PATH = os.path.join(EXPORT_DIR, "combined_cointegration_results.json")
+TRADING_SIGNALS_PATH = os.path.join(EXPORT_DIR, "recent_trading_signals.json")
+IBOV_STOCKS_PATH = os.path.join(EXPORT_DIR, "IBOV_stocks.json")
+CUMULATIVE_PERFORMANCE_PATH = os.path.join(EXPORT_DIR, "cumulative_performance_data.json")
+DIVIDEND_CALENDAR_PATH = os.path.join(EXPORT_DIR, "dividend_calender.json")
 
-class RRGDataResource(Resource):
+# Marks a field an option doesn't have, as opposed to one set to None
+_MISSING = object()
+
+# Row positions of an empty selection
+_NO_ROWS = np.empty(0, dtype=np.intp)
+
+# Option fields whose few distinct values repeat across thousands of options
+_INTERNED_FIELDS = ('parent_symbol', 'maturity_type')
+
+# Well-formed Brazilian amount: dotted (or plain) integer part, comma, decimal digits
+_BR_DECIMAL_RE = re.compile(r'(-?[\d.]*\d[\d.]*),(\d+)')
+
+
+def _json_response(obj, status=200):
+    """Serialize obj with the app's orjson provider straight into a Response"""
+    response = current_app.json.response(obj)
+    response.status_code = status
+    return response
+
+
+def _load_json(json_file_path):
+    """Parse a JSON export file with orjson, reading it through a read-only memory map"""
+    with open(json_file_path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                try:
+                    return orjson.loads(view)
+                except orjson.JSONDecodeError:
+                    # json.dump writes NaN/Infinity by default, which only the stdlib parser accepts
+                    return json.loads(bytes(view))
+
+
+def _intern_fields(item, fields=_INTERNED_FIELDS):
+    """Replace the string values of the given fields of a dict with their interned copies"""
+    for field in fields:
+        value = item.get(field)
+        if type(value) is str:
+            item[field] = sys.intern(value)
+
+
+def _float_column(values):
+    """float64 array of values, with None and anything non-numeric as NaN"""
+    return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _stable_order(sort_key, limit=None):
+    """
+    Positions that stably sort the sort_key array ascending, cut to the first limit
+    when limit is a positive count below its length
+    
+    Only the first positions are needed then, so they are partially selected in O(N)
+    and just those are sorted; every value tied with the cut-off is kept as a candidate
+    so ties come out in the same order as in a full stable sort
+    """
+    if limit and 0 < limit < len(sort_key):
+        cutoff = np.partition(sort_key, limit - 1)[limit - 1]
+        candidates = np.flatnonzero(sort_key <= cutoff)
+        if len(candidates) >= limit:
+            return candidates[np.argsort(sort_key[candidates], kind='stable')[:limit]]
+    return np.argsort(sort_key, kind='stable')
+
+
+def _field_key(field, missing=0):
+    """Sort key reading field from a dict, where an absent or None value counts as missing"""
+    def key(item):
+        value = item.get(field)
+        return missing if value is None else value
+    return key
+
+
+def _sorted_head(items, key, reverse=False, limit=None):
+    """
+    sorted(items, key=key, reverse=reverse), cut to the first limit items when limit is a positive count
+    
+    A limit well below the number of items is served from a heap in O(N log limit)
+    instead of sorting everything; heapq keeps ties in their original order, like sorted
+    """
+    if limit and 0 < limit <= len(items) // 4:
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(limit, items, key=key)
+    return sorted(items, key=key, reverse=reverse)
+
+
+def _group_by(items, key):
+    """Group items into {key(item): [items...]}, keeping their original order within each group"""
+    groups = {}
+    for item in items:
+        groups.setdefault(key(item), []).append(item)
+    return groups
+
+
+def _parse_brazilian_currency(value_str):
+    """Parse Brazilian currency format ("R$ 1.234,56", "0,017250") to float, 0.0 if unparseable"""
+    if not value_str:
+        return 0.0
+
+    # Remove R$ symbol and surrounding spaces
+    value_str = str(value_str).replace("R$", "").strip()
+
+    # Nearly every export value is a plain "digits,digits" amount; one regex match
+    # covers it without the split/branch cascade below
+    match = _BR_DECIMAL_RE.fullmatch(value_str)
+    if match:
+        return float(f"{match.group(1).replace('.', '')}.{match.group(2)}")
+
+    if not value_str:
+        return 0.0
+
+    try:
+        if "," in value_str:
+            parts = value_str.split(",")
+            if len(parts) != 2:
+                # Multiple commas - invalid format
+                return 0.0
+            # Remove dots from integer part (thousand separators)
+            value_str = f"{parts[0].replace('.', '')}.{parts[1]}"
+        elif value_str.count(".") > 1:
+            # Multiple dots - thousand separators, remove all dots
+            value_str = value_str.replace(".", "")
+        # A single dot is taken as the decimal separator
+
+        return float(value_str)
+    except (ValueError, AttributeError):
+        current_app.logger.warning(f"Could not parse currency value: {value_str}")
+        return 0.0
+
+
+def _upper(value):
+    """Upper-case copy of a string, anything else as it is"""
+    return value.upper() if isinstance(value, str) else value
+
+
+def _stat(json_file_path):
+    """
+    os.stat of an export file, taken once per request however many layers (conditional
+    response, response cache, the view itself) ask for it
+    
+    The memo lives in the WSGI environ rather than in g: an app context that is already
+    pushed is reused, g and all, by every request made inside it
+    """
+    file_stats = request.environ.setdefault('zq.export_file_stats', {})
+    file_stat = file_stats.get(json_file_path)
+    if file_stat is None:
+        file_stat = file_stats[json_file_path] = os.stat(json_file_path)
+    return file_stat
+
+
+def _file_digest(json_file_path):
+    """BLAKE2b digest of a file's content, read in chunks"""
+    digest = hashlib.blake2b()
+    with open(json_file_path, 'rb') as file:
+        for chunk in iter(functools.partial(file.read, 1 << 20), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _cached_load(build):
+    """
+    Decorate build(json_file_path), which derives a resource's data from an export
+    file, so that it only runs again once the file has changed
+    
+    A file whose mtime and size are unchanged is taken as unchanged. A new mtime with
+    the same size is settled by comparing content digests, so a file that is only
+    touched, or re-exported with identical content, keeps its data
+    
+    Up-to-date entries are read without locking; a reload holds a lock, so concurrent
+    requests that find the file changed wait for one build instead of each running it
+    """
+    entries = {}
+    lock = threading.Lock()
+    
+    @functools.wraps(build)
+    def wrapper(json_file_path):
+        file_stat = _stat(json_file_path)
+        version = (file_stat.st_mtime_ns, file_stat.st_size)
+        entry = entries.get(json_file_path)
+        if entry is not None and entry[0] == version:
+            return entry[2]
+        
+        with lock:
+            # Another request may have reloaded the file while this one waited
+            entry = entries.get(json_file_path)
+            if entry is not None and entry[0] == version:
+                return entry[2]
+            
+            digest = _file_digest(json_file_path)
+            if entry is not None and entry[1] == digest:
+                entries[json_file_path] = (version, digest, entry[2])
+                return entry[2]
+            
+            data = build(json_file_path)
+            entries[json_file_path] = (version, digest, data)
+            return data
+    return wrapper
+
+
+def _conditional_on_file(*json_file_paths, bypass=None):
+    """
+    Decorate a get() whose response is derived only from the files at json_file_paths
+    
+    Successful responses carry a weak ETag and Last-Modified taken from the files'
+    mtimes and sizes, and a matching If-None-Match / If-Modified-Since is answered
+    with an empty 304 without running the view at all. Requests for which
+    bypass(request.args) is true are left alone
+    """
+    def decorator(get):
+        @functools.wraps(get)
+        def wrapper(*args, **kwargs):
+            if bypass is not None and bypass(request.args):
+                return get(*args, **kwargs)
+            
+            try:
+                file_stats = [_stat(json_file_path) for json_file_path in json_file_paths]
+            except OSError:
+                # Let the view report the missing file as it normally does
+                return get(*args, **kwargs)
+            
+            etag = ".".join(f"{file_stat.st_mtime_ns:x}-{file_stat.st_size:x}" for file_stat in file_stats)
+            last_modified = datetime.fromtimestamp(
+                int(max(file_stat.st_mtime for file_stat in file_stats)), tz=timezone.utc
+            )
+            
+            # If-Modified-Since is only considered when the client sent no ETag
+            if request.if_none_match:
+                not_modified = request.if_none_match.contains_weak(etag)
+            else:
+                not_modified = request.if_modified_since is not None and request.if_modified_since >= last_modified
+            
+            if not_modified:
+                response = current_app.response_class(status=304)
+            else:
+                response = get(*args, **kwargs)
+                if response.status_code != 200:
+                    return response
+            
+            response.set_etag(etag, weak=True)
+            response.last_modified = last_modified
+            # Clients may keep the body but must revalidate before reusing it
+            response.cache_control.no_cache = True
+            return response
+        return wrapper
+    return decorator
+
+
+def _cached_response(*json_file_paths, params, max_bytes=8 << 20, bypass=None):
+    """
+    Decorate a get() whose response is derived only from the files at json_file_paths
+    and the query parameters named in params, keeping the most recent successful
+    response bodies up to max_bytes in total
+    
+    Entries are keyed on the first value of each of params, which is all the views read,
+    so unknown or cache-busting parameters never add entries. They are all dropped as
+    soon as the files' mtime or size changes. Requests for which bypass(request.args) is
+    true always run the view
+    """
+    def decorator(get):
+        responses = OrderedDict()
+        # File versions the entries were built from, and their total body size
+        state = {'versions': None, 'size': 0}
+        lock = threading.Lock()
+        
+        @functools.wraps(get)
+        def wrapper(*args, **kwargs):
+            if bypass is not None and bypass(request.args):
+                return get(*args, **kwargs)
+            
+            try:
+                versions = tuple((st.st_mtime_ns, st.st_size) for st in map(_stat, json_file_paths))
+            except OSError:
+                # Let the view report the missing file as it normally does
+                return get(*args, **kwargs)
+            
+            key = tuple(map(request.args.get, params))
+            with lock:
+                if versions != state['versions']:
+                    responses.clear()
+                    state['versions'] = versions
+                    state['size'] = 0
+                cached = responses.get(key)
+                if cached is not None:
+                    responses.move_to_end(key)
+            if cached is not None:
+                body, mimetype = cached
+                return current_app.response_class(body, mimetype=mimetype)
+            
+            response = get(*args, **kwargs)
+            if response.status_code == 200:
+                body = response.get_data()
+                with lock:
+                    # Skip bodies over the budget, and ones built while the files changed
+                    if len(body) <= max_bytes and versions == state['versions'] and key not in responses:
+                        responses[key] = (body, response.mimetype)
+                        state['size'] += len(body)
+                        while state['size'] > max_bytes:
+                            _, (evicted_body, _) = responses.popitem(last=False)
+                            state['size'] -= len(evicted_body)
+            return response
+        return wrapper
+    return decorator
+
+
+class RRGDataResource(MethodView):
+    # Cache for RRG data to avoid re-reading and re-parsing the file on every request
+    _cache = {
+        'arrays': None,
+        'last_updated': None
+    }
+    
+    # Quadrant names indexed by (rs_ratio >= 100) * 2 + (rs_momentum >= 100)
+    _QUADRANT_LABELS = np.array(['lagging', 'improving', 'weakening', 'leading'])
+    
+    @staticmethod
+    def _build_arrays(rrg_data):
+        """Flatten the per-symbol series into contiguous column arrays, one row per (symbol, date)"""
+        names, codes, dates, ratios, momentums = [], [], [], [], []
+        slices = {}
+        for symbol_key, data in rrg_data.items():
+            # Skip if the data doesn't have required fields
+            if not all(k in data for k in ['Dates', 'RS_Ratio', 'RS_Momentum']):
+                continue
+            
+            # Only dates that have both a ratio and a momentum value are usable
+            n = min(len(data['Dates']), len(data['RS_Ratio']), len(data['RS_Momentum']))
+            slices[symbol_key] = (len(dates), len(dates) + n)
+            codes.extend([len(names)] * n)
+            names.append(symbol_key)
+            dates.extend(data['Dates'][:n])
+            ratios.extend(data['RS_Ratio'][:n])
+            momentums.extend(data['RS_Momentum'][:n])
+        
+        ratio = np.asarray(ratios, dtype=np.float64)
+        momentum = np.asarray(momentums, dtype=np.float64)
+        names = np.array(names, dtype=object)
+        # Position of each symbol in alphabetical order, used as its sort key
+        symbol_rank = np.empty(len(names), dtype=np.int32)
+        symbol_rank[np.argsort(names, kind='stable')] = np.arange(len(names), dtype=np.int32)
+        return {
+            'names': names,
+            'symbol_rank': symbol_rank,
+            'symbol_code': np.asarray(codes, dtype=np.int32),
+            'dates': np.array(dates, dtype=object),
+            'rs_ratio': ratio,
+            'rs_momentum': momentum,
+            'quadrant': ((ratio >= 100).astype(np.int8) * 2 + (momentum >= 100)).astype(np.int8),
+            'slices': slices
+        }
+    
+    @_conditional_on_file(RRG_DATA_PATH)
     def get(self):
         try:
             # Get the full path to the rrg_data.json file
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            json_file_path = os.path.join(base_dir, "utils", "export", "rrg_data.json")
+            json_file_path = RRG_DATA_PATH
             
-            current_app.logger.info(f"Attempting to read RRG data from: {json_file_path}")
+            # Check if data is already cached and file hasn't been modified
+            file_mtime = _stat(json_file_path).st_mtime
             
-            # Read the JSON file
-            with open(json_file_path, 'r') as file:
-                rrg_data = json.load(file)
+            if (self._cache['arrays'] is None or 
+                self._cache['last_updated'] is None or 
+                self._cache['last_updated'] < file_mtime):
+                
+                current_app.logger.info(f"Attempting to read RRG data from: {json_file_path}")
+                
+                # Read the JSON file
+                rrg_data = _load_json(json_file_path)
+                
+                self._cache['arrays'] = self._build_arrays(rrg_data)
+                self._cache['last_updated'] = file_mtime
+                
+                current_app.logger.info(f"RRG data successfully retrieved")
             
-            current_app.logger.info(f"RRG data successfully retrieved")
+            arrays = self._cache['arrays']
             
             # Get query parameters
             symbol = request.args.get('symbol')
@@ -49,15 +427,14 @@ class RRGDataResource(Resource):
             limit = request.args.get('limit', type=int)
             date = request.args.get('date')  # Get data for specific date
             
-            # Filter by symbol if provided
-            filtered_data = {}
+            # Filter by symbol if provided, keeping the order the symbols were requested in
             if symbol:
-                symbols = symbol.split(',')
-                for sym in symbols:
-                    if sym in rrg_data:
-                        filtered_data[sym] = rrg_data[sym]
+                rows = [np.arange(*arrays['slices'][sym])
+                        for sym in dict.fromkeys(symbol.split(','))
+                        if sym in arrays['slices']]
+                rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.intp)
             else:
-                filtered_data = rrg_data
+                rows = np.arange(len(arrays['rs_ratio']))
             
             # Filter by quadrant if provided
             if quadrant:
@@ -79,70 +456,67 @@ class RRGDataResource(Resource):
                     if 'max_rs_momentum' in q_filters and max_rs_momentum is None:
                         max_rs_momentum = q_filters['max_rs_momentum']
             
-            # Process and filter the data
-            result = []
-            for symbol_key, data in filtered_data.items():
-                # Skip if the data doesn't have required fields
-                if not all(k in data for k in ['Dates', 'RS_Ratio', 'RS_Momentum']):
-                    continue
-                
-                # Get the data for each date and apply filters
-                for i, date_val in enumerate(data['Dates']):
-                    # Skip if we don't have enough data points
-                    if i >= len(data['RS_Ratio']) or i >= len(data['RS_Momentum']):
-                        continue
-                    
-                    # Skip if we're looking for a specific date and this isn't it
-                    if date and date_val != date:
-                        continue
-                    
-                    rs_ratio = data['RS_Ratio'][i]
-                    rs_momentum = data['RS_Momentum'][i]
-                    
-                    # Apply numerical filters
-                    if min_rs_ratio is not None and rs_ratio < min_rs_ratio:
-                        continue
-                    if max_rs_ratio is not None and rs_ratio > max_rs_ratio:
-                        continue
-                    if min_rs_momentum is not None and rs_momentum < min_rs_momentum:
-                        continue
-                    if max_rs_momentum is not None and rs_momentum > max_rs_momentum:
-                        continue
-                    
-                    # If we reach here, all filters passed
-                    result.append({
-                        'symbol': symbol_key,
-                        'date': date_val,
-                        'rs_ratio': rs_ratio,
-                        'rs_momentum': rs_momentum,
-                        # Determine the quadrant based on values
-                        'quadrant': 'leading' if rs_ratio >= 100 and rs_momentum >= 100 else
-                                   'weakening' if rs_ratio >= 100 and rs_momentum < 100 else
-                                   'lagging' if rs_ratio < 100 and rs_momentum < 100 else
-                                   'improving'
-                    })
-            
-            # Sort results if requested
+            # Apply the date and numerical filters as a single boolean mask
+            ratio = arrays['rs_ratio'][rows]
+            momentum = arrays['rs_momentum'][rows]
+            mask = np.ones(len(rows), dtype=bool)
+            if date:
+                mask &= arrays['dates'][rows] == date
+            if min_rs_ratio is not None:
+                mask &= ratio >= min_rs_ratio
+            if max_rs_ratio is not None:
+                mask &= ratio <= max_rs_ratio
+            if min_rs_momentum is not None:
+                mask &= momentum >= min_rs_momentum
+            if max_rs_momentum is not None:
+                mask &= momentum <= max_rs_momentum
+            idx = rows[mask]
+            
+            # Sort results if requested (stable, so ties keep their original order)
             if sort_by == 'rs_ratio':
-                result.sort(key=lambda x: x['rs_ratio'], reverse=(sort_order == 'desc'))
+                sort_key = arrays['rs_ratio'][idx]
             elif sort_by == 'rs_momentum':
-                result.sort(key=lambda x: x['rs_momentum'], reverse=(sort_order == 'desc'))
+                sort_key = arrays['rs_momentum'][idx]
             else:  # Default sort by symbol
-                result.sort(key=lambda x: x['symbol'], reverse=(sort_order == 'desc'))
+                sort_key = arrays['symbol_rank'][arrays['symbol_code'][idx]]
+            if sort_order == 'desc':
+                sort_key = -sort_key
+            
+            idx = idx[_stable_order(sort_key, limit)]
             
             # Apply limit if provided
-            if limit and len(result) > limit:
-                result = result[:limit]
+            if limit and len(idx) > limit:
+                idx = idx[:limit]
+            
+            # Only the rows that made it into the response are turned into dicts
+            quadrant_codes = arrays['quadrant'][idx]
+            result = [
+                {
+                    'symbol': symbol_key,
+                    'date': date_val,
+                    'rs_ratio': rs_ratio,
+                    'rs_momentum': rs_momentum,
+                    'quadrant': quadrant_name
+                }
+                for symbol_key, date_val, rs_ratio, rs_momentum, quadrant_name in zip(
+                    arrays['names'][arrays['symbol_code'][idx]].tolist(),
+                    arrays['dates'][idx].tolist(),
+                    arrays['rs_ratio'][idx].tolist(),
+                    arrays['rs_momentum'][idx].tolist(),
+                    self._QUADRANT_LABELS[quadrant_codes].tolist()
+                )
+            ]
             
             # Get all unique symbols in the filtered result
-            symbols_in_result = list(set([item['symbol'] for item in result]))
+            symbols_in_result = arrays['names'][np.unique(arrays['symbol_code'][idx])].tolist()
             
-            # Count items in each quadrant
+            # Count items in each quadrant in a single pass
+            counts = np.bincount(quadrant_codes, minlength=4)
             quadrant_counts = {
-                'leading': sum(1 for item in result if item['quadrant'] == 'leading'),
-                'weakening': sum(1 for item in result if item['quadrant'] == 'weakening'),
-                'lagging': sum(1 for item in result if item['quadrant'] == 'lagging'),
-                'improving': sum(1 for item in result if item['quadrant'] == 'improving')
+                'leading': int(counts[3]),
+                'weakening': int(counts[2]),
+                'lagging': int(counts[0]),
+                'improving': int(counts[1])
             }
             
             # Create the response
@@ -165,25 +539,105 @@ class RRGDataResource(Resource):
                 'results': result
             }
             
-            return make_response(jsonify(response), 200)
+            return _json_response(response, 200)
         except Exception as e:
             current_app.logger.error(f"Error in RRGDataResource: {str(e)}")
-            return make_response(jsonify({'error': 'Internal Server Error', 'details': str(e)}), 500)
+            return _json_response({'error': 'Internal Server Error', 'details': str(e)}, 500)
 
-class BrRecommendationsResource(Resource):
+class BrRecommendationsResource(MethodView):
+    # Cache for recommendations data to avoid repeated file operations
+    _cache = {
+        'data': None,
+        'df': None,  # One row per ticker, holding the raw JSON values
+        'b3_body': None,  # Serialized B3 view of the whole file
+        'analysis': None,  # (data, analyze_all(data)) for the whole file
+        'last_updated': None
+    }
+    
+    _ANALYZERS = {
+        'ibov': analyze_ibovlist,
+        'strong_buy': analyze_strongbuy,
+        'buy': analyze_buy,
+    }
+    
+    # Fields shown by the B3 view
+    _B3_COLUMNS = [
+        "currentPrice",
+        "targetHighPrice",
+        "targetLowPrice",
+        "targetMeanPrice",
+        "targetMedianPrice",
+        "recommendationMean",
+        "recommendationKey",
+        "numberOfAnalystOpinions",
+        "averageAnalystRating"
+    ]
+    
+    @classmethod
+    def _b3_payload(cls, recommendations_df):
+        """Build the B3 view: only the fields we need for B3 display, per ticker"""
+        # Columns no ticker has are added as float NaN, so cast back to object for None
+        b3_df = recommendations_df.reindex(columns=cls._B3_COLUMNS).astype(object)
+        # Only a ticker without the key shows "none", an explicit null stays null. In the
+        # object-dtype frame the former is NaN and the latter None
+        recommendation_key = b3_df['recommendationKey']
+        key_missing = recommendation_key.isna() & recommendation_key.map(lambda value: value is not None)
+        b3_df = b3_df.where(b3_df.notna(), None)
+        b3_df.loc[key_missing, 'recommendationKey'] = "none"
+        formatted_data = b3_df.to_dict(orient='index')
+        return {
+            "analysis": "B3 recommendations",
+            "count": len(formatted_data),
+            "description": "B3 stocks with analyst recommendations",
+            "results": formatted_data
+        }
+    
+    def _analyze(self, recommendations_data, analysis_type):
+        """
+        Runs one of the ranking analyses. For the whole file all of them are
+        computed together, once per file load, and copies of the cached
+        records are returned since callers annotate them.
+        """
+        if recommendations_data is not self._cache['data']:
+            return self._ANALYZERS[analysis_type](recommendations_data)
+        
+        cached = self._cache['analysis']
+        if cached is None or cached[0] is not recommendations_data:
+            cached = (recommendations_data, analyze_all(recommendations_data))
+            self._cache['analysis'] = cached
+        return [dict(item) for item in cached[1][analysis_type]]
+    
+    @_conditional_on_file(BR_RECOMMENDATIONS_PATH)
     def get(self):
         try:
             # Get the full path to the all_BR_recommendations.json file
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            json_file_path = os.path.join(base_dir, "utils", "export", "all_BR_recommendations.json")
-            
-            current_app.logger.info(f"Attempting to read BR recommendations data from: {json_file_path}")
+            json_file_path = BR_RECOMMENDATIONS_PATH
             
-            # Read the JSON file
-            with open(json_file_path, 'r') as file:
-                recommendations_data = json.load(file)
+            # Check if data is already cached and file hasn't been modified
+            file_mtime = _stat(json_file_path).st_mtime
             
-            current_app.logger.info(f"BR recommendations data successfully retrieved")
+            if (self._cache['data'] is None or 
+                self._cache['last_updated'] is None or 
+                self._cache['last_updated'] < file_mtime):
+                
+                current_app.logger.info(f"Attempting to read BR recommendations data from: {json_file_path}")
+                
+                # Read the JSON file
+                recommendations_data = _load_json(json_file_path)
+                
+                # dtype=object keeps the values exactly as parsed (ints stay ints)
+                tickers = [ticker for ticker, data in recommendations_data.items() if isinstance(data, dict)]
+                self._cache['df'] = pd.DataFrame(
+                    [recommendations_data[ticker] for ticker in tickers], index=tickers, dtype=object)
+                # The unfiltered B3 view only changes with the file, so serialize it once here
+                self._cache['b3_body'] = current_app.json.dumps(self._b3_payload(self._cache['df']))
+                self._cache['data'] = recommendations_data
+                self._cache['last_updated'] = file_mtime
+                
+                current_app.logger.info(f"BR recommendations data successfully retrieved")
+            else:
+                recommendations_data = self._cache['data']
+            recommendations_df = self._cache['df']
             
             # Get query parameters
             symbol = request.args.get('symbol')
@@ -192,81 +646,53 @@ class BrRecommendationsResource(Resource):
             # Filter by symbol if provided
             if symbol and symbol in recommendations_data:
                 recommendations_data = {symbol: recommendations_data[symbol]}
+                recommendations_df = recommendations_df.loc[recommendations_df.index == symbol]
                 
             # Process response based on analysis_type
             result = None
             
             if analysis_type == 'ibov':
-                from app.utils.all_BR_recommendations import analyze_ibovlist
-                result = analyze_ibovlist(recommendations_data)
+                result = self._analyze(recommendations_data, 'ibov')
                 
-                # Filter out entries with NaN values
+                # Filter out entries with None or NaN values in any field
                 if result:
-                    # Filter out items with None or NaN values in key fields
-                    filtered_result = []
-                    for item in result:
-                        has_nan = False
-                        for key, value in item.items():
-                            if value is None or (isinstance(value, float) and math.isnan(value)):
-                                has_nan = True
-                                break
-                        if not has_nan:
-                            filtered_result.append(item)
-                    
-                    result = filtered_result
+                    complete = pd.DataFrame(result).notna().all(axis=1).tolist()
+                    result = [item for item, keep in zip(result, complete) if keep]
                 
-                return make_response(jsonify({
+                return _json_response({
                     "analysis": "IBOV stocks analysis",
                     "count": len(result),
                     "description": "Ibovespa stocks ranked by relevance with analyst data",
                     "results": result
-                }), 200)
+                }, 200)
             
             elif analysis_type == 'b3':
-                # Extract only the fields we need for B3 display
-                formatted_data = {}
-                for ticker, data in recommendations_data.items():
-                    if isinstance(data, dict):  # Make sure the data is a dictionary
-                        formatted_data[ticker] = {
-                            "currentPrice": data.get("currentPrice"),
-                            "targetHighPrice": data.get("targetHighPrice"),
-                            "targetLowPrice": data.get("targetLowPrice"),
-                            "targetMeanPrice": data.get("targetMeanPrice"),
-                            "targetMedianPrice": data.get("targetMedianPrice"),
-                            "recommendationMean": data.get("recommendationMean"),
-                            "recommendationKey": data.get("recommendationKey", "none"),
-                            "numberOfAnalystOpinions": data.get("numberOfAnalystOpinions"),
-                            "averageAnalystRating": data.get("averageAnalystRating")
-                        }                
-                return make_response(jsonify({
-                    "analysis": "B3 recommendations",
-                    "count": len(formatted_data),
-                    "description": "B3 stocks with analyst recommendations",
-                    "results": formatted_data
-                }), 200)
+                if recommendations_df is self._cache['df']:
+                    return current_app.response_class(self._cache['b3_body'], mimetype='application/json')
+                return _json_response(self._b3_payload(recommendations_df), 200)
             
             elif analysis_type == 'buy':
-                result = analyze_buy(recommendations_data)
-                return make_response(jsonify({
+                result = self._analyze(recommendations_data, 'buy')
+                return _json_response({
                     "analysis": "Buy recommendations",
                     "description": "Stocks with analyst buy recommendations sorted by relevance",
                     "count": len(result),
                     "results": result
-                }), 200)
+                }, 200)
             
             elif analysis_type == 'strong_buy':
-                result = analyze_strongbuy(recommendations_data)
-                return make_response(jsonify({
+                result = self._analyze(recommendations_data, 'strong_buy')
+                return _json_response({
                     "analysis": "Strong Buy recommendations",
                     "description": "Stocks with analyst strong buy recommendations sorted by relevance",
                     "count": len(result),
                     "results": result
-                }), 200)
+                }, 200)
                 
             elif analysis_type == 'all_buy':
                 # Combine both strong_buy and buy analyses
-                strong_buys = analyze_strongbuy(recommendations_data)
-                buys = analyze_buy(recommendations_data)
+                strong_buys = self._analyze(recommendations_data, 'strong_buy')
+                buys = self._analyze(recommendations_data, 'buy')
                 
                 # Add a type field to distinguish between them
                 for item in strong_buys:
@@ -279,14 +705,19 @@ class BrRecommendationsResource(Resource):
                 combined = strong_buys + buys
                 
                 # Make sure return_target_consensus is properly handled for all items
-                for item in combined:
-                    if 'return_target_consensus' not in item:
-                        # Calculate it if missing using the same formula from the analyzer functions
-                        item['return_target_consensus'] = (
-                            (item.get('% Distance to Median', 0) * 0.4) + 
-                            (item.get('% Distance to High', 0) * 0.3) + 
-                            (item.get('% Distance to Mean', 0) * 0.3)
-                        )
+                missing = [item for item in combined if 'return_target_consensus' not in item]
+                if missing:
+                    # Calculate it if missing using the same formula from the analyzer functions
+                    distances = pd.DataFrame(missing).reindex(
+                        columns=['% Distance to Median', '% Distance to High', '% Distance to Mean']
+                    ).apply(pd.to_numeric, errors='coerce').fillna(0)
+                    consensus = (
+                        (distances['% Distance to Median'] * 0.4) + 
+                        (distances['% Distance to High'] * 0.3) + 
+                        (distances['% Distance to Mean'] * 0.3)
+                    )
+                    for item, value in zip(missing, consensus.tolist()):
+                        item['return_target_consensus'] = value
                 
                 # Sort combined results by score
                 combined.sort(key=lambda x: x.get('combined_score', 0), reverse=True)
@@ -295,40 +726,38 @@ class BrRecommendationsResource(Resource):
                 for i, item in enumerate(combined):
                     item['relevance'] = i + 1
                     
-                return make_response(jsonify({
+                return _json_response({
                     "analysis": "All Buy recommendations (strong buy + buy)",
                     "description": "Combined analysis of strong buy and buy recommendations",
                     "count": len(combined),
                     "strong_buy_count": len(strong_buys),
                     "buy_count": len(buys),
                     "results": combined
-                }), 200)
+                }, 200)
             
             else:
                 # Return raw data
-                return make_response(jsonify({
+                return _json_response({
                     "analysis": "Raw data",
                     "count": len(recommendations_data),
                     "results": recommendations_data
-                }), 200)
+                }, 200)
                 
         except Exception as e:
-            current_app.logger.error(f"Error in BrRecommendationsResource: {str(e)}")
-            current_app.logger.error(traceback.format_exc())
-            return make_response(jsonify({'error': 'Internal Server Error', 'details': str(e)}), 500)
+            current_app.logger.exception("Error in BrRecommendationsResource: %s", e)
+            return _json_response({'error': 'Internal Server Error', 'details': str(e)}, 500)
 
-class ScreenerRSIResource(Resource):
+class ScreenerRSIResource(MethodView):
+    @_conditional_on_file(RSI_SCREENER_PATH)
     def get(self):
         try:
             # Get the full path to the screener_overbought_oversold_rsi_results.json file
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            json_file_path = os.path.join(base_dir, "utils", "export", "screener_overbought_oversold_rsi_results.json")
+            json_file_path = RSI_SCREENER_PATH
             
             current_app.logger.info(f"Attempting to read RSI screener data from: {json_file_path}")
             
             # Read the JSON file
-            with open(json_file_path, 'r') as file:
-                rsi_data = json.load(file)
+            rsi_data = _load_json(json_file_path)
             
             current_app.logger.info(f"RSI screener data successfully retrieved")
             
@@ -348,26 +777,189 @@ class ScreenerRSIResource(Resource):
                             condition: rsi_data[timeframe_key][condition]
                         }
                     
-                    return make_response(jsonify(filtered_data), 200)
+                    return _json_response(filtered_data, 200)
                 else:
-                    return make_response(jsonify({'error': f'Timeframe {timeframe} not found'}), 404)
+                    return _json_response({'error': f'Timeframe {timeframe} not found'}, 404)
             
             # Return all data if no filters are applied
-            return make_response(jsonify(rsi_data), 200)
+            return _json_response(rsi_data, 200)
             
         except Exception as e:
-            current_app.logger.error(f"Error in ScreenerRSIResource: {str(e)}")
-            current_app.logger.error(traceback.format_exc())
-            return make_response(jsonify({'error': 'Internal Server Error', 'details': str(e)}), 500)
+            current_app.logger.exception("Error in ScreenerRSIResource: %s", e)
+            return _json_response({'error': 'Internal Server Error', 'details': str(e)}, 500)
 
-class VolatilitySurfaceResource(Resource):
+class VolatilitySurfaceResource(MethodView):
     # Cache for volatility data to avoid repeated file operations
     _cache = {
         'data': None,
         'last_updated': None,
-        'aggregated_data': {}  # Cache for aggregated/downsampled data
+        'options': {},  # Per-symbol options that have the fields needed for visualization
+        'columns': {}  # Per-symbol dictionary-encoded filter columns, aligned with 'options'
     }
     
+    @staticmethod
+    def _complete_options(options):
+        """Keep only option entries with the bs and strike values the visualizations need"""
+        return [option for option in options
+                if isinstance(option, dict) and 'bs' in option and 'strike' in option]
+    
+    @staticmethod
+    def _encode_column(values):
+        """
+        Dictionary-encode one filter column as (codes, categories)
+        
+        Options that don't have the field get code -1 so they pass any filter on it
+        """
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+        # pandas hashes the whole column in C; the missing-field sentinel becomes one more category
+        codes, uniques = pd.factorize(column, use_na_sentinel=False)
+        codes = codes.astype(np.int32)
+        
+        categories = {}
+        for code, value in enumerate(uniques):
+            if value is _MISSING:
+                codes[codes == code] = -1
+            else:
+                categories[value] = code
+        return codes, categories
+    
+    @classmethod
+    def _build_columns(cls, options):
+        """Split the per-option filter fields into one array per field (struct of arrays)"""
+        return {
+            'type': cls._encode_column([option.get('type', _MISSING) for option in options]),
+            'due_date': cls._encode_column([option.get('due_date', _MISSING) for option in options]),
+            'maturity_type': cls._encode_column([option.get('maturity_type', _MISSING) for option in options]),
+            'moneyness': cls._encode_column([option.get('moneyness', _MISSING) for option in options]),
+            # float32 is plenty for plotting and halves what these columns hold and send
+            'strike': np.asarray([option['strike'] for option in options], dtype=np.float32),
+            'bs': np.asarray([option['bs'] for option in options], dtype=np.float32)  # None becomes NaN
+        }
+    
+    @staticmethod
+    def _column_mask(column, value):
+        """Options whose field equals value, or that don't have the field at all"""
+        codes, categories = column
+        return (codes == categories.get(value, -2)) | (codes == -1)
+    
+    @staticmethod
+    def _expiry_mask(column, expiry_date):
+        """Options expiring on expiry_date (date part of due_date), or without a due_date"""
+        codes, categories = column
+        matching = [code for due_date, code in categories.items()
+                    if isinstance(due_date, str) and due_date.split('T')[0] == expiry_date]
+        return np.isin(codes, matching) | (codes == -1)
+    
+    @staticmethod
+    def _column_values(column, idx):
+        """Distinct values of an encoded column among the options at idx"""
+        codes, categories = column
+        values = {code: value for value, code in categories.items()}
+        present = np.unique(codes[idx])
+        return [values[code] for code in present[present >= 0].tolist()]
+    
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _process(cls, key, option_type, expiry_date, maturity_type, moneyness, resolution, data_format, version):
+        """
+        Filter, sample and format the options of one symbol
+        
+        Results are memoized per argument tuple in a bounded LRU; version is the data
+        file's mtime, so results computed from an older file are never returned again
+        and simply age out
+        """
+        # Entries without bs/strike were already dropped when the file was loaded
+        options_with_complete_data = cls._cache['options'][key]
+        
+        # Apply filters as one boolean mask over the encoded columns
+        columns = cls._cache['columns'][key]
+        mask = np.ones(len(options_with_complete_data), dtype=bool)
+        if option_type:
+            mask &= cls._column_mask(columns['type'], option_type)
+        if expiry_date:
+            mask &= cls._expiry_mask(columns['due_date'], expiry_date)
+        if maturity_type:
+            mask &= cls._column_mask(columns['maturity_type'], maturity_type)
+        if moneyness:
+            mask &= cls._column_mask(columns['moneyness'], moneyness)
+        filtered_idx = np.flatnonzero(mask)
+        
+        # If no options left after filtering, return an empty list
+        if not len(filtered_idx):
+            return []
+        
+        # Apply resolution-based sampling to reduce data size by picking
+        # evenly spaced positions out of the filtered indices
+        sampled_idx = filtered_idx
+        if resolution == 'low':
+            # Keep ~20% of the data points
+            sample_size = max(10, len(filtered_idx) // 5)
+            sampled_idx = filtered_idx[np.linspace(0, len(filtered_idx)-1, sample_size, dtype=int)]
+        elif resolution == 'medium':
+            # Keep ~50% of the data points
+            sample_size = max(20, len(filtered_idx) // 2)
+            sampled_idx = filtered_idx[np.linspace(0, len(filtered_idx)-1, sample_size, dtype=int)]
+        
+        # Format the output based on the requested format
+        if data_format == 'surface':
+            # For 3D surface visualization - return full option objects
+            processed_data = [options_with_complete_data[i] for i in sampled_idx.tolist()]
+        elif data_format == 'grid':
+            # For grid visualization - a strikes x expiries matrix of bs values,
+            # with null where there is no option for that pair
+            due_codes, due_categories = columns['due_date']
+            strike = columns['strike'][sampled_idx]
+            grid_idx = sampled_idx[~np.isnan(strike) & (due_codes[sampled_idx] >= 0)]
+        
+            strikes, strike_pos = np.unique(columns['strike'][grid_idx], return_inverse=True)
+            expiry_codes, expiry_pos = np.unique(due_codes[grid_idx], return_inverse=True)
+        
+            # Order the expiry axis by the due_date strings themselves
+            due_values = {code: due_date for due_date, code in due_categories.items()}
+            expiries = np.array([due_values[code] for code in expiry_codes.tolist()], dtype=object)
+            expiry_order = np.argsort(expiries, kind='stable')
+            expiry_rank = np.empty(len(expiries), dtype=np.intp)
+            expiry_rank[expiry_order] = np.arange(len(expiries))
+        
+            # The first option for a (strike, expiry) pair wins
+            cells = strike_pos * len(expiries) + expiry_rank[expiry_pos]
+            cells, first = np.unique(cells, return_index=True)
+            values = np.full((len(strikes), len(expiries)), np.nan, dtype=np.float32)
+            values.flat[cells] = columns['bs'][grid_idx[first]]
+        
+            processed_data = {
+                'strikes': strikes,
+                'expiries': expiries[expiry_order].tolist(),
+                'values': values
+            }
+        elif data_format == 'summary':
+            # For summary view - provide statistics about the data
+            bs_values = columns['bs'][sampled_idx]
+            bs_values = bs_values[~np.isnan(bs_values)]
+        
+            if bs_values.size:
+                processed_data = {
+                    'count': len(sampled_idx),
+                    'min_bs': bs_values.min(),
+                    'max_bs': bs_values.max(),
+                    'avg_bs': float(bs_values.mean(dtype=np.float64)),
+                    'option_types': cls._column_values(columns['type'], sampled_idx),
+                    'expiry_dates': cls._column_values(columns['due_date'], sampled_idx),
+                    'maturity_types': cls._column_values(columns['maturity_type'], sampled_idx)
+                }
+            else:
+                processed_data = {
+                    'count': 0,
+                    'error': 'No valid data points found'
+                }
+        else:
+            # Default: just return the sampled options
+            processed_data = [options_with_complete_data[i] for i in sampled_idx.tolist()]
+        
+        return processed_data
+    
+    @_conditional_on_file(VOLATILITY_SURFACE_PATH)
     def get(self):
         try:
             # Get query parameters
@@ -384,11 +976,10 @@ class VolatilitySurfaceResource(Resource):
             data_format = request.args.get('format', 'surface')  # surface, grid, summary
             
             # Get the full path to the volatility_surface.json file
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            json_file_path = os.path.join(base_dir, "utils", "export", "volatility_surface.json")
+            json_file_path = VOLATILITY_SURFACE_PATH
             
             # Check if data is already cached and file hasn't been modified
-            file_mtime = os.path.getmtime(json_file_path)
+            file_mtime = _stat(json_file_path).st_mtime
             
             if (self._cache['data'] is None or 
                 self._cache['last_updated'] is None or 
@@ -397,13 +988,20 @@ class VolatilitySurfaceResource(Resource):
                 current_app.logger.info(f"Loading volatility surface data from file: {json_file_path}")
                 
                 # Read the JSON file
-                with open(json_file_path, 'r') as file:
-                    volatility_data = json.load(file)
+                volatility_data = _load_json(json_file_path)
                 
                 # Cache the data and update timestamp
                 self._cache['data'] = volatility_data
+                self._cache['options'] = {
+                    key: self._complete_options(options)
+                    for key, options in volatility_data.items()
+                    if isinstance(options, list)
+                }
+                self._cache['columns'] = {
+                    key: self._build_columns(options)
+                    for key, options in self._cache['options'].items()
+                }
                 self._cache['last_updated'] = file_mtime
-                self._cache['aggregated_data'] = {}  # Reset aggregated data cache
                 
                 current_app.logger.info(f"Volatility surface data cached successfully")
             else:
@@ -417,152 +1015,123 @@ class VolatilitySurfaceResource(Resource):
                 if symbol in volatility_data:
                     result[symbol] = volatility_data[symbol]
                 else:
-                    return make_response(jsonify({'error': f'Symbol {symbol} not found'}), 404)
+                    return _json_response({'error': f'Symbol {symbol} not found'}, 404)
             else:
                 # Return list of available symbols only instead of all data
                 if data_format == 'list':
                     available_symbols = list(volatility_data.keys())
-                    return make_response(jsonify({
+                    return _json_response({
                         'symbols': available_symbols,
                         'count': len(available_symbols)
-                    }), 200)
+                    }, 200)
                 else:
-                    result = volatility_data  # Return all data if no symbol specified
+                    # Return all data if no symbol specified; copied so processing below
+                    # doesn't overwrite the cached raw data
+                    result = dict(volatility_data)
             
             # Process each symbol in the result
             for key in list(result.keys()):
                 if isinstance(result[key], list):
-                    # Create a cache key for this specific request
-                    cache_key = f"{key}_{option_type}_{expiry_date}_{maturity_type}_{moneyness}_{resolution}_{data_format}"
-                    
-                    # Check if we have this result cached
-                    if cache_key in self._cache['aggregated_data']:
-                        result[key] = self._cache['aggregated_data'][cache_key]
-                        current_app.logger.info(f"Using cached processed data for {cache_key}")
-                        continue
-                    
-                    # Preprocess to add missing fields for incomplete entries
-                    options_with_complete_data = []
-                    for option in result[key]:
-                        if not isinstance(option, dict):
-                            continue
-                        
-                        # Keep only entries with bs value (essential for visualization)
-                        if 'bs' not in option:
-                            continue
-                            
-                        # NEW: Ensure the option has required fields for visualization
-                        if 'strike' not in option:
-                            # For simple data entries with just 'bs', skip or add defaults
-                            # based on the visualization requirements
-                            continue
-                        
-                        options_with_complete_data.append(option)
-                    
-                    # Apply filters
-                    filtered_options = []
-                    for option in options_with_complete_data:
-                        include = True
-                        
-                        if option_type and 'type' in option and option['type'] != option_type:
-                            include = False
-                            
-                        if expiry_date and 'due_date' in option:
-                            option_date = option['due_date'].split('T')[0] if 'T' in option['due_date'] else option['due_date']
-                            if option_date != expiry_date:
-                                include = False
-                                
-                        if maturity_type and 'maturity_type' in option and option['maturity_type'] != maturity_type:
-                            include = False
-                            
-                        if moneyness and 'moneyness' in option and option['moneyness'] != moneyness:
-                            include = False
-                            
-                        if include:
-                            filtered_options.append(option)
-                    
-                    # If no options left after filtering, continue with empty list
-                    if not filtered_options:
-                        result[key] = []
-                        continue
-                    
-                    # Apply resolution-based sampling to reduce data size
-                    sampled_options = filtered_options
-                    if resolution == 'low':
-                        # Keep ~20% of the data points
-                        sample_size = max(10, len(filtered_options) // 5)
-                        indices = np.linspace(0, len(filtered_options)-1, sample_size, dtype=int)
-                        sampled_options = [filtered_options[i] for i in indices]
-                    elif resolution == 'medium':
-                        # Keep ~50% of the data points
-                        sample_size = max(20, len(filtered_options) // 2)
-                        indices = np.linspace(0, len(filtered_options)-1, sample_size, dtype=int)
-                        sampled_options = [filtered_options[i] for i in indices]
-                    
-                    # Format the output based on the requested format
-                    if data_format == 'surface':
-                        # For 3D surface visualization - return full option objects
-                        processed_data = sampled_options
-                    elif data_format == 'grid':
-                        # For grid visualization - group by strike and expiry to create a grid
-                        strike_expiry_map = {}
-                        for option in sampled_options:
-                            strike = option.get('strike')
-                            expiry = option.get('due_date')
-                            
-                            if strike is not None and expiry is not None:
-                                if strike not in strike_expiry_map:
-                                    strike_expiry_map[strike] = {}
-                                
-                                if expiry not in strike_expiry_map[strike]:
-                                    strike_expiry_map[strike][expiry] = option.get('bs')
-                        
-                        processed_data = {
-                            'strikes': sorted(list(strike_expiry_map.keys())),
-                            'expiries': sorted(list(set([e for s in strike_expiry_map.values() for e in s.keys()]))),
-                            'values': strike_expiry_map
-                        }
-                    elif data_format == 'summary':
-                        # For summary view - provide statistics about the data
-                        bs_values = [o.get('bs') for o in sampled_options if o.get('bs') is not None]
-                        
-                        if bs_values:
-                            processed_data = {
-                                'count': len(sampled_options),
-                                'min_bs': min(bs_values),
-                                'max_bs': max(bs_values),
-                                'avg_bs': sum(bs_values) / len(bs_values),
-                                'option_types': list(set([o.get('type') for o in sampled_options if 'type' in o])),
-                                'expiry_dates': list(set([o.get('due_date') for o in sampled_options if 'due_date' in o])),
-                                'maturity_types': list(set([o.get('maturity_type') for o in sampled_options if 'maturity_type' in o]))
-                            }
-                        else:
-                            processed_data = {
-                                'count': 0,
-                                'error': 'No valid data points found'
-                            }
-                    else:
-                        # Default: just return the sampled options
-                        processed_data = sampled_options
-                    
-                    # Store in cache for future requests
-                    self._cache['aggregated_data'][cache_key] = processed_data
-                    result[key] = processed_data
+                    result[key] = self._process(key, option_type, expiry_date, maturity_type, moneyness,
+                                                resolution, data_format, self._cache['last_updated'])
             
-            return make_response(jsonify(result), 200)
+            return _json_response(result, 200)
             
         except Exception as e:
-            current_app.logger.error(f"Error in VolatilitySurfaceResource: {str(e)}")
-            current_app.logger.error(traceback.format_exc())
-            return make_response(jsonify({'error': 'Internal Server Error', 'details': str(e)}), 500)
+            current_app.logger.exception("Error in VolatilitySurfaceResource: %s", e)
+            return _json_response({'error': 'Internal Server Error', 'details': str(e)}, 500)
 
-class CollarResource(Resource):
+class CollarResource(MethodView):
     # Cache for collar data to avoid repeated file operations
     _cache = {
-        'data': None,
+        'tables': None,  # category -> maturity range -> combined call/put entries with their columns
         'last_updated': None
     }
     
+    @staticmethod
+    def _combine(call, put):
+        """
+        Create a combined entry with both call and put data
+        
+        call is the call without its puts; it is shared by every entry of that call
+        """
+        return {
+            'call': call,
+            'put': put,
+            'strategy': {
+                'parent_symbol': call.get('parent_symbol'),
+                'days_to_maturity': call.get('days_to_maturity'),
+                'maturity_type': put.get('maturity_type'),
+                'gain_to_risk_ratio': put.get('gain_to_risk_ratio'),
+                'combined_score': put.get('combined_score'),
+                'intrinsic_protection': put.get('intrinsic_protection', False),
+                'zero_risk': put.get('zero_risk', False),
+                'pm_result': put.get('pm_result'),
+                'cdi_relative_return': put.get('cdi_relative_return'),
+                'call_symbol': call.get('symbol'),
+                'put_symbol': put.get('symbol'),
+                'call_strike': call.get('strike'),
+                'put_strike': put.get('strike'),
+                'total_gain': put.get('total_gain'),
+                'total_risk': put.get('total_risk')
+            }
+        }
+    
+    @classmethod
+    def _flatten(cls, collar_data):
+        """
+        Pair every call with each of its puts, once per file load
+        
+        Puts with zero or very low premiums (less than 0.01) are dropped here, as are
+        entries that aren't proper option objects
+        """
+        return {
+            category: {
+                m_range: [
+                    cls._combine(call_without_puts, put)
+                    for call in options if isinstance(call, dict)
+                    for call_without_puts in ({k: v for k, v in call.items() if k != 'puts'},)
+                    for put in call.get('puts', [])
+                    if isinstance(put, dict) and put.get('close', 0) >= 0.01
+                ]
+                for m_range, options in maturity_ranges.items()
+            }
+            for category, maturity_ranges in collar_data.items()
+        }
+    
+    @staticmethod
+    def _build_table(entries):
+        """
+        Lay out the strategy fields requests filter and sort on as NumPy columns
+        
+        Rows follow entries; missing numbers are NaN in the columns and 0 in the sort
+        keys, and by_symbol maps each parent symbol to its row positions in file order
+        """
+        strategies = [combined['strategy'] for combined in entries]
+        gain_to_risk = _float_column([strategy['gain_to_risk_ratio'] for strategy in strategies])
+        combined_score = _float_column([strategy['combined_score'] for strategy in strategies])
+        return {
+            'entries': entries,
+            'gain_to_risk_ratio': gain_to_risk,
+            'sort_keys': {
+                'gain_to_risk_ratio': np.where(np.isnan(gain_to_risk), 0.0, gain_to_risk),
+                'combined_score': np.where(np.isnan(combined_score), 0.0, combined_score),
+                'days_to_maturity': _float_column([strategy['days_to_maturity'] for strategy in strategies]),
+            },
+            'by_symbol': {
+                symbol: np.array(rows, dtype=np.intp)
+                for symbol, rows in _group_by(
+                    range(len(strategies)), lambda row: strategies[row]['parent_symbol']
+                ).items()
+            },
+        }
+    
+    # The query parameters get() reads; its cached responses are keyed on these alone
+    _QUERY_PARAMS = ('category', 'maturity_range', 'symbol', 'min_gain_to_risk', 'sort_by',
+        'sort_order', 'limit')
+    
+    @_conditional_on_file(COLLAR_PATH)
+    @_cached_response(COLLAR_PATH, params=_QUERY_PARAMS)
     def get(self):
         try:
             # Get query parameters
@@ -575,30 +1144,44 @@ class CollarResource(Resource):
             limit = request.args.get('limit', type=int)  # Limit number of results
             
             # Get the full path to the collar_organized.json file
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            json_file_path = os.path.join(base_dir, "utils", "export", "collar_organized.json")
+            json_file_path = COLLAR_PATH
             
             # Check if data is already cached and file hasn't been modified
-            file_mtime = os.path.getmtime(json_file_path)
+            file_mtime = _stat(json_file_path).st_mtime
             
-            if (self._cache['data'] is None or 
+            if (self._cache['tables'] is None or 
                 self._cache['last_updated'] is None or 
                 self._cache['last_updated'] < file_mtime):
                 
                 current_app.logger.info(f"Loading collar strategy data from file: {json_file_path}")
                 
                 # Read the JSON file
-                with open(json_file_path, 'r') as file:
-                    collar_data = json.load(file)
+                collar_data = _load_json(json_file_path)
                 
-                # Cache the data and update timestamp
-                self._cache['data'] = collar_data
+                # Share one copy of each repeated symbol / maturity type string
+                for maturity_ranges in collar_data.values():
+                    for options in maturity_ranges.values():
+                        for call in options:
+                            if isinstance(call, dict):
+                                _intern_fields(call)
+                                for put in call.get('puts', []):
+                                    if isinstance(put, dict):
+                                        _intern_fields(put)
+                
+                # Cache the flattened data with its columns and update timestamp
+                self._cache['tables'] = {
+                    category: {
+                        m_range: self._build_table(entries)
+                        for m_range, entries in maturity_ranges.items()
+                    }
+                    for category, maturity_ranges in self._flatten(collar_data).items()
+                }
                 self._cache['last_updated'] = file_mtime
                 
                 current_app.logger.info(f"Collar strategy data cached successfully")
             else:
-                collar_data = self._cache['data']
                 current_app.logger.info(f"Using cached collar strategy data")
+            collar_data = self._cache['tables']
             
             # Filter by category if provided
             if category and category in collar_data:
@@ -616,12 +1199,11 @@ class CollarResource(Resource):
             result = self._process_collar_data(filtered_data, symbol, min_gain_to_risk, sort_by, sort_order, limit)
             
             # Return the filtered and processed data
-            return make_response(jsonify(result), 200)
+            return _json_response(result, 200)
             
         except Exception as e:
-            current_app.logger.error(f"Error in CollarResource: {str(e)}")
-            current_app.logger.error(traceback.format_exc())
-            return make_response(jsonify({'error': 'Internal Server Error', 'details': str(e)}), 500)
+            current_app.logger.exception("Error in CollarResource: %s", e)
+            return _json_response({'error': 'Internal Server Error', 'details': str(e)}, 500)
     
     def _process_collar_data(self, data, symbol=None, min_gain_to_risk=None, sort_by='gain_to_risk_ratio', sort_order='desc', limit=None):
         result = {}
@@ -630,148 +1212,110 @@ class CollarResource(Resource):
         for category, maturity_ranges in data.items():
             result[category] = {}
             
-            for m_range, options in maturity_ranges.items():
-                # Flatten all calls with their puts for easier filtering
-                flattened_options = []
+            for m_range, table in maturity_ranges.items():
+                # Filter by symbol if provided, through the index built at load
+                if symbol:
+                    rows = table['by_symbol'].get(symbol, _NO_ROWS)
+                else:
+                    rows = np.arange(len(table['entries']))
                 
-                for call in options:
-                    # Skip if not a proper call option object
-                    if not isinstance(call, dict):
-                        continue
-                        
-                    # Filter by symbol if provided
-                    if symbol and call.get('parent_symbol') != symbol:
-                        continue
-                    
-                    # Extract the puts from each call
-                    puts = call.get('puts', [])
-                    
-                    # Process each put attached to this call
-                    for put in puts:
-                        # Skip if not a proper put option object
-                        if not isinstance(put, dict):
-                            continue
-                            
-                        # Filter out puts with zero or very low premiums (less than 0.01)
-                        put_premium = put.get('close', 0)
-                        if put_premium < 0.01:
-                            continue
-                            
-                        # Filter by minimum gain_to_risk_ratio if provided
-                        if min_gain_to_risk is not None and (
-                            'gain_to_risk_ratio' not in put or 
-                            put['gain_to_risk_ratio'] is None or 
-                            put['gain_to_risk_ratio'] < min_gain_to_risk
-                        ):
-                            continue
-                        
-                        # Create a combined entry with both call and put data
-                        combined = {
-                            'call': {k: v for k, v in call.items() if k != 'puts'},
-                            'put': put,
-                            'strategy': {
-                                'parent_symbol': call.get('parent_symbol'),
-                                'days_to_maturity': call.get('days_to_maturity'),
-                                'maturity_type': put.get('maturity_type'),
-                                'gain_to_risk_ratio': put.get('gain_to_risk_ratio'),
-                                'combined_score': put.get('combined_score'),
-                                'intrinsic_protection': put.get('intrinsic_protection', False),
-                                'zero_risk': put.get('zero_risk', False),
-                                'pm_result': put.get('pm_result'),
-                                'cdi_relative_return': put.get('cdi_relative_return'),
-                                'call_symbol': call.get('symbol'),
-                                'put_symbol': put.get('symbol'),
-                                'call_strike': call.get('strike'),
-                                'put_strike': put.get('strike'),
-                                'total_gain': put.get('total_gain'),
-                                'total_risk': put.get('total_risk')
-                            }
-                        }
-                        
-                        flattened_options.append(combined)
+                # Filter by minimum gain_to_risk_ratio if provided; NaN (no ratio) never passes
+                if min_gain_to_risk is not None:
+                    rows = rows[table['gain_to_risk_ratio'][rows] >= min_gain_to_risk]
                 
-                # Sort the flattened options
-                if sort_by == 'gain_to_risk_ratio':
-                    # Default sorting by gain_to_risk_ratio
-                    flattened_options.sort(
-                        key=lambda x: (
-                            x['strategy'].get('gain_to_risk_ratio', 0) 
-                            if x['strategy'].get('gain_to_risk_ratio') is not None 
-                            else 0
-                        ), 
-                        reverse=(sort_order == 'desc')
-                    )
-                elif sort_by == 'combined_score':
-                    # Sort by combined score
-                    flattened_options.sort(
-                        key=lambda x: (
-                            x['strategy'].get('combined_score', 0) 
-                            if x['strategy'].get('combined_score') is not None 
-                            else 0
-                        ), 
-                        reverse=(sort_order == 'desc')
-                    )
-                elif sort_by == 'days_to_maturity':
-                    # Sort by days to maturity
-                    flattened_options.sort(
-                        key=lambda x: x['strategy'].get('days_to_maturity', 0), 
-                        reverse=(sort_order == 'desc')
-                    )
+                # Sort the remaining rows; a stable sort keeps ties in file order either way
+                if sort_by in table['sort_keys']:
+                    key = table['sort_keys'][sort_by][rows]
+                    rows = rows[_stable_order(-key if sort_order == 'desc' else key, limit)]
                 
                 # Apply limit if provided
-                if limit and len(flattened_options) > limit:
-                    flattened_options = flattened_options[:limit]
+                if limit and len(rows) > limit:
+                    rows = rows[:limit]
                 
                 # Store the processed options in the result
-                result[category][m_range] = flattened_options
+                entries = table['entries']
+                result[category][m_range] = [entries[row] for row in rows.tolist()]
         
         # Add metadata to the response
-        metadata = self._generate_metadata(result)
+        metadata = self._generate_metadata(result, data)
         
         return {
             "metadata": metadata,
             "results": result
         }
     
-    def _generate_metadata(self, data):
-        total_count = 0
+    def _generate_metadata(self, data, tables):
+        """
+        Summarize the processed results
+        
+        tables are the tables the results were selected from; a maturity range that
+        came back in full reuses the symbols indexed at load instead of walking its entries
+        """
         symbols = set()
         category_counts = {}
-        maturity_range_counts = {}
+        maturity_range_counts = Counter()
         
         # Calculate counts and extract symbols
         for category, maturity_ranges in data.items():
-            category_counts[category] = 0
+            category_counts[category] = sum(map(len, maturity_ranges.values()))
             
             for m_range, options in maturity_ranges.items():
-                count = len(options)
-                total_count += count
-                category_counts[category] += count
-                
-                if m_range not in maturity_range_counts:
-                    maturity_range_counts[m_range] = 0
-                maturity_range_counts[m_range] += count
+                maturity_range_counts[m_range] += len(options)
                 
                 # Extract unique symbols
-                for option in options:
-                    if 'strategy' in option and 'parent_symbol' in option['strategy']:
-                        symbols.add(option['strategy']['parent_symbol'])
+                table = tables[category][m_range]
+                if len(options) == len(table['entries']):
+                    symbols.update(table['by_symbol'])
+                else:
+                    symbols.update(option['strategy']['parent_symbol'] for option in options)
         
         return {
-            "total_count": total_count,
+            "total_count": sum(category_counts.values()),
             "symbol_count": len(symbols),
             "unique_symbols": list(symbols),
             "category_counts": category_counts,
-            "maturity_range_counts": maturity_range_counts
+            "maturity_range_counts": dict(maturity_range_counts)
         }
 
-class CoveredCallResource(Resource):
+class CoveredCallResource(MethodView):
     # Cache for covered call data to avoid repeated file operations
     _cache = {
-        'data': None,
+        'tables': None,  # maturity range -> tradeable options with their columns
         'last_updated': None
     }
     
+    @staticmethod
+    def _build_table(options):
+        """
+        Keep the tradeable options of a maturity range, with the fields requests filter on as NumPy columns
+        
+        Entries that aren't proper option objects and options with zero or very low
+        premiums (bid under 0.01) are dropped; by_symbol maps each parent symbol to its
+        row positions in file order
+        """
+        options = [option for option in options if isinstance(option, dict)]
+        # Share one copy of each repeated symbol / maturity type string
+        for option in options:
+            _intern_fields(option)
+        bid = _float_column([option.get('bid', 0) for option in options])
+        options = [option for option, tradeable in zip(options, (bid >= 0.01).tolist()) if tradeable]
+        return {
+            'options': options,
+            'cdi_relative_return': _float_column([option.get('cdi_relative_return') for option in options]),
+            'by_symbol': {
+                symbol: np.array(rows, dtype=np.intp)
+                for symbol, rows in _group_by(
+                    range(len(options)), lambda row: options[row].get('parent_symbol')
+                ).items()
+            },
+        }
+    
+    # The query parameters get() reads; its cached responses are keyed on these alone
+    _QUERY_PARAMS = ('maturity_range', 'symbol', 'min_cdi_relative_return', 'sort_by',
+        'sort_order', 'limit')
+    
+    @_conditional_on_file(COVERED_CALL_PATH)
+    @_cached_response(COVERED_CALL_PATH, params=_QUERY_PARAMS)
     def get(self):
         try:
             # Get query parameters
@@ -783,30 +1327,31 @@ class CoveredCallResource(Resource):
             limit = request.args.get('limit', type=int)  # Limit number of results
             
             # Get the full path to the covered_calls_organized.json file
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            json_file_path = os.path.join(base_dir, "utils", "export", "covered_calls_organized.json")
+            json_file_path = COVERED_CALL_PATH
             
             # Check if data is already cached and file hasn't been modified
-            file_mtime = os.path.getmtime(json_file_path)
+            file_mtime = _stat(json_file_path).st_mtime
             
-            if (self._cache['data'] is None or 
+            if (self._cache['tables'] is None or 
                 self._cache['last_updated'] is None or 
                 self._cache['last_updated'] < file_mtime):
                 
                 current_app.logger.info(f"Loading covered call strategy data from file: {json_file_path}")
                 
                 # Read the JSON file
-                with open(json_file_path, 'r') as file:
-                    covered_call_data = json.load(file)
+                covered_call_data = _load_json(json_file_path)
                 
-                # Cache the data and update timestamp
-                self._cache['data'] = covered_call_data
+                # Cache the tradeable options with their columns and update timestamp
+                self._cache['tables'] = {
+                    range_key: self._build_table(options)
+                    for range_key, options in covered_call_data.items()
+                }
                 self._cache['last_updated'] = file_mtime
                 
                 current_app.logger.info(f"Covered call strategy data cached successfully")
             else:
-                covered_call_data = self._cache['data']
                 current_app.logger.info(f"Using cached covered call strategy data")
+            covered_call_data = self._cache['tables']
             
             result = {}
             unique_symbols = set()
@@ -819,43 +1364,37 @@ class CoveredCallResource(Resource):
                 filtered_data = covered_call_data
             
             # Process each maturity range in the filtered data
-            for range_key, options in filtered_data.items():
-                filtered_options = []
+            for range_key, table in filtered_data.items():
+                # Filter by symbol if provided, through the index built at load
+                if symbol:
+                    rows = table['by_symbol'].get(symbol, _NO_ROWS)
+                else:
+                    rows = np.arange(len(table['options']))
                 
-                # Apply filters to each option
-                for option in options:
-                    # Skip if not a proper option object
-                    if not isinstance(option, dict):
-                        continue
-                    
-                    # Filter out options with zero or very low premiums (less than 0.01)
-                    bid_price = option.get('bid', 0)
-                    if bid_price < 0.01:
-                        continue
-                    
-                    # Filter by symbol if provided
-                    if symbol and option.get('parent_symbol') != symbol:
-                        continue
-                    
-                    # Filter by minimum cdi_relative_return if provided
-                    if min_cdi_relative_return is not None:
-                        if 'cdi_relative_return' not in option or option['cdi_relative_return'] < min_cdi_relative_return:
-                            continue
-                    
-                    # If we reach here, all filters passed
-                    filtered_options.append(option)
-                    
-                    # Collect unique symbols
+                # Filter by minimum cdi_relative_return if provided; NaN (no return) never passes
+                if min_cdi_relative_return is not None:
+                    rows = rows[table['cdi_relative_return'][rows] >= min_cdi_relative_return]
+                
+                # Gather the selected options and collect their unique symbols in the same pass
+                options = table['options']
+                filtered_options = []
+                append_option = filtered_options.append
+                add_symbol = unique_symbols.add
+                for row in rows.tolist():
+                    option = options[row]
+                    append_option(option)
                     if 'parent_symbol' in option:
-                        unique_symbols.add(option['parent_symbol'])
+                        add_symbol(option['parent_symbol'])
                 
                 # Apply sorting if there are options in this range
                 if filtered_options:
                     # Sort by the requested field
                     if sort_by in filtered_options[0]:
-                        filtered_options.sort(
-                            key=lambda x: x.get(sort_by, 0) if x.get(sort_by) is not None else 0,
-                            reverse=(sort_order == 'desc')
+                        filtered_options = _sorted_head(
+                            filtered_options,
+                            key=_field_key(sort_by),
+                            reverse=(sort_order == 'desc'),
+                            limit=limit
                         )
                     
                     # Apply limit if provided
@@ -884,31 +1423,43 @@ class CoveredCallResource(Resource):
             }
             
             # Return the filtered and processed data
-            return make_response(jsonify({
+            return _json_response({
                 "metadata": metadata,
                 "results": result
-            }), 200)
+            }, 200)
             
         except Exception as e:
-            current_app.logger.error(f"Error in CoveredCallResource: {str(e)}")
-            current_app.logger.error(traceback.format_exc())
-            return make_response(jsonify({'error': 'Internal Server Error', 'details': str(e)}), 500)
+            current_app.logger.exception("Error in CoveredCallResource: %s", e)
+            return _json_response({'error': 'Internal Server Error', 'details': str(e)}, 500)
 
-class PairsTradingResource(Resource):
+def _is_pair_details_request(args):
+    """Pair details are computed fresh by get_pair_details, from files other than the pairs exports"""
+    return args.get('data_type') == 'pair_details'
+
+
+class PairsTradingResource(MethodView):
     # Cache for pairs trading data to avoid repeated file operations
     _cache = {
         'cointegration_data': None,
         'trading_signals_data': None,
+        'cointegration_index': None,  # period -> pair/asset index of its results
+        'trading_signals_index': None,  # pair/asset index of last_5_days_signals
         'cointegration_last_updated': None,
         'trading_signals_last_updated': None
     }
     
+    # The query parameters get() reads; its cached responses are keyed on these alone
+    _QUERY_PARAMS = ('data_type', 'period', 'asset1', 'asset2', 'signal_type',
+        'cointegrated_only', 'min_zscore', 'max_zscore', 'min_beta', 'max_beta',
+        'min_half_life', 'max_half_life', 'sort_by', 'sort_order', 'limit')
+    
+    @_conditional_on_file(COINTEGRATION_PATH, TRADING_SIGNALS_PATH, bypass=_is_pair_details_request)
+    @_cached_response(COINTEGRATION_PATH, TRADING_SIGNALS_PATH, params=_QUERY_PARAMS, bypass=_is_pair_details_request)
     def get(self):
         try:
             # Get the full paths to the data files
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            cointegration_path = os.path.join(base_dir, "utils", "export", "combined_cointegration_results.json")
-            signals_path = os.path.join(base_dir, "utils", "export", "recent_trading_signals.json")
+            cointegration_path = COINTEGRATION_PATH
+            signals_path = TRADING_SIGNALS_PATH
             
             # Update the cache if needed
             self._update_cache(cointegration_path, signals_path)
@@ -954,7 +1505,7 @@ class PairsTradingResource(Resource):
             # Handle specific asset pair details request
             if asset1 and asset2 and data_type == 'pair_details':
                 pair_details = get_pair_details(asset1, asset2, period)
-                return make_response(jsonify(pair_details), 200)
+                return _json_response(pair_details, 200)
             
             # Get cointegration data if requested
             if data_type in ['all', 'cointegration']:
@@ -970,34 +1521,108 @@ class PairsTradingResource(Resource):
                 )
                 response["signals"] = signals_data
             
-            return make_response(jsonify(response), 200)
+            return _json_response(response, 200)
             
         except Exception as e:
             current_app.logger.error(f"Error in PairsTradingResource: {str(e)}")
-            return make_response(jsonify({'error': 'Internal Server Error', 'details': str(e)}), 500)
+            return _json_response({'error': 'Internal Server Error', 'details': str(e)}, 500)
     
     def _update_cache(self, cointegration_path, signals_path):
         """Update the cache if the files have been modified"""
         try:
             # Check cointegration file
             if os.path.exists(cointegration_path):
-                last_modified = os.path.getmtime(cointegration_path)
+                last_modified = _stat(cointegration_path).st_mtime
                 if self._cache['cointegration_last_updated'] != last_modified:
-                    with open(cointegration_path, 'r') as file:
-                        self._cache['cointegration_data'] = json.load(file)
+                    cointegration_data = _load_json(cointegration_path)
+                    self._cache['cointegration_data'] = cointegration_data
+                    self._cache['cointegration_index'] = {
+                        period: self._index_pairs(period_data.get("results", []))
+                        for period, period_data in cointegration_data.items()
+                    }
                     self._cache['cointegration_last_updated'] = last_modified
             
             # Check signals file
             if os.path.exists(signals_path):
-                last_modified = os.path.getmtime(signals_path)
+                last_modified = _stat(signals_path).st_mtime
                 if self._cache['trading_signals_last_updated'] != last_modified:
-                    with open(signals_path, 'r') as file:
-                        self._cache['trading_signals_data'] = json.load(file)
+                    signals_data = _load_json(signals_path)
+                    # Keep only proper signal objects, so filtering can rely on them
+                    signals_data["last_5_days_signals"] = [
+                        signal for signal in signals_data.get("last_5_days_signals", []) if isinstance(signal, dict)
+                    ]
+                    self._cache['trading_signals_data'] = signals_data
+                    self._cache['trading_signals_index'] = {
+                        **self._index_pairs(signals_data["last_5_days_signals"]),
+                        **self._index_zscores(signals_data["last_5_days_signals"]),
+                    }
                     self._cache['trading_signals_last_updated'] = last_modified
                     
         except Exception as e:
             current_app.logger.error(f"Error updating cache: {str(e)}")
             
+    @staticmethod
+    def _index_pairs(items):
+        """
+        Index the positions of pairs or signals by their unordered (asset1, asset2) pair
+        and by each of their assets, keeping list order
+        """
+        by_pair = {}
+        by_asset = {}
+        for position, item in enumerate(items):
+            assets = (item.get("asset1"), item.get("asset2"))
+            by_pair.setdefault(frozenset(assets), []).append(position)
+            for asset in dict.fromkeys(assets):
+                by_asset.setdefault(asset, []).append(position)
+        return {'by_pair': by_pair, 'by_asset': by_asset}
+    
+    @staticmethod
+    def _index_zscores(signals):
+        """
+        Order the signal positions by current_zscore, those without one last, so z-score
+        ranges can be looked up with np.searchsorted
+        """
+        zscores = _float_column([signal.get("current_zscore") for signal in signals])
+        by_zscore = np.argsort(zscores, kind='stable')
+        return {
+            'by_zscore': by_zscore,
+            'zscores_sorted': zscores[by_zscore],
+            'zscore_count': int(np.count_nonzero(~np.isnan(zscores))),
+        }
+    
+    @staticmethod
+    def _select_zscore_range(items, index, min_zscore=None, max_zscore=None):
+        """
+        The items whose z-score is within the bounds, plus those without one (which
+        always pass), in list order
+        """
+        count = index['zscore_count']
+        zscores = index['zscores_sorted'][:count]
+        low = np.searchsorted(zscores, min_zscore, side='left') if min_zscore is not None else 0
+        high = np.searchsorted(zscores, max_zscore, side='right') if max_zscore is not None else count
+        by_zscore = index['by_zscore']
+        positions = np.sort(np.concatenate((by_zscore[low:high], by_zscore[count:])))
+        return [items[position] for position in positions.tolist()]
+    
+    @staticmethod
+    def _select_assets(items, index, asset1=None, asset2=None):
+        """The items involving the given assets, in either order, looked up in their index"""
+        if asset1 and asset2:
+            positions = index['by_pair'].get(frozenset((asset1, asset2)), [])
+        elif asset1 or asset2:
+            positions = index['by_asset'].get(asset1 or asset2, [])
+        else:
+            return items
+        return [items[position] for position in positions]
+    
+    @staticmethod
+    def _in_range(value, minimum=None, maximum=None):
+        """Whether value lies within the optional bounds; a missing value always passes"""
+        return value is None or (
+            (minimum is None or value >= minimum) and
+            (maximum is None or value <= maximum)
+        )
+    
     def _get_cointegration_data(self, period, asset1=None, asset2=None, cointegrated_only=True):
         """Filter and return cointegration data"""
         if not self._cache['cointegration_data'] or period not in self._cache['cointegration_data']:
@@ -1007,26 +1632,14 @@ class PairsTradingResource(Resource):
         period_data = self._cache['cointegration_data'].get(period, {})
         results = period_data.get("results", [])
         
-        # Filter the results
-        filtered_results = []
-        for pair in results:
-            # Skip if we need only cointegrated pairs and this is not cointegrated
-            if cointegrated_only and not pair.get("cointegrated", False):
-                continue
-                
-            # Filter by assets if specified
-            if asset1 and asset2:
-                if not ((pair.get("asset1") == asset1 and pair.get("asset2") == asset2) or 
-                        (pair.get("asset1") == asset2 and pair.get("asset2") == asset1)):
-                    continue
-            elif asset1:
-                if pair.get("asset1") != asset1 and pair.get("asset2") != asset1:
-                    continue
-            elif asset2:
-                if pair.get("asset1") != asset2 and pair.get("asset2") != asset2:
-                    continue
-                
-            filtered_results.append(pair)
+        # Filter by assets if specified
+        results = self._select_assets(results, self._cache['cointegration_index'][period], asset1, asset2)
+        
+        # Skip pairs that are not cointegrated if we need only cointegrated pairs
+        filtered_results = [
+            pair for pair in results
+            if not cointegrated_only or pair.get("cointegrated", False)
+        ]
             
         # Create a summary of filtered data
         cointegrated_count = sum(1 for pair in filtered_results if pair.get("cointegrated", False))
@@ -1052,57 +1665,35 @@ class PairsTradingResource(Resource):
             
         signals = self._cache['trading_signals_data'].get("last_5_days_signals", [])
         
+        # Filter by assets if specified, otherwise by z-score range through its sorted index
+        signals_index = self._cache['trading_signals_index']
+        if asset1 or asset2:
+            signals = self._select_assets(signals, signals_index, asset1, asset2)
+        elif min_zscore is not None or max_zscore is not None:
+            signals = self._select_zscore_range(signals, signals_index, min_zscore, max_zscore)
+            min_zscore = max_zscore = None
+        
         # Filter the signals
-        filtered_signals = []
-        for signal in signals:
-            # Filter by assets if specified
-            if asset1 and asset2:
-                if not ((signal.get("asset1") == asset1 and signal.get("asset2") == asset2) or 
-                        (signal.get("asset1") == asset2 and signal.get("asset2") == asset1)):
-                    continue
-            elif asset1:
-                if signal.get("asset1") != asset1 and signal.get("asset2") != asset1:
-                    continue
-            elif asset2:
-                if signal.get("asset1") != asset2 and signal.get("asset2") != asset2:
-                    continue
-                
+        filtered_signals = [
+            signal for signal in signals
             # Filter by signal type
-            if signal_type and signal.get("signal_type") != signal_type:
-                continue
-                
+            if (not signal_type or signal.get("signal_type") == signal_type)
             # Filter by z-score
-            current_zscore = signal.get("current_zscore")
-            if current_zscore is not None:
-                if min_zscore is not None and current_zscore < min_zscore:
-                    continue
-                if max_zscore is not None and current_zscore > max_zscore:
-                    continue
-            
+            and self._in_range(signal.get("current_zscore"), min_zscore, max_zscore)
             # Filter by beta (hedge ratio)
-            beta = signal.get("beta")
-            if beta is not None:
-                if min_beta is not None and beta < min_beta:
-                    continue
-                if max_beta is not None and beta > max_beta:
-                    continue
-            
+            and self._in_range(signal.get("beta"), min_beta, max_beta)
             # Filter by half-life (mean reversion speed in days)
-            half_life = signal.get("half_life")
-            if half_life is not None:
-                if min_half_life is not None and half_life < min_half_life:
-                    continue
-                if max_half_life is not None and half_life > max_half_life:
-                    continue
-            
-            filtered_signals.append(signal)
+            and self._in_range(signal.get("half_life"), min_half_life, max_half_life)
+        ]
             
         # Sort the signals
         if sort_by in ['signal_date', 'current_zscore', 'p_value', 'beta', 'half_life']:
             try:
-                filtered_signals.sort(
-                    key=lambda x: x.get(sort_by, 0) if x.get(sort_by) is not None else float('inf' if sort_order == 'asc' else '-inf'), 
-                    reverse=(sort_order == 'desc')
+                filtered_signals = _sorted_head(
+                    filtered_signals,
+                    key=_field_key(sort_by, missing=float('inf' if sort_order == 'asc' else '-inf')),
+                    reverse=(sort_order == 'desc'),
+                    limit=limit
                 )
             except Exception as e:
                 current_app.logger.error(f"Error sorting signals: {str(e)}")
@@ -1117,12 +1708,11 @@ class PairsTradingResource(Resource):
             filtered_signals = filtered_signals[:limit]
             
         # Create a summary of filtered data
-        buy_count = sum(1 for signal in filtered_signals if signal.get("signal_type") == "buy")
-        sell_count = sum(1 for signal in filtered_signals if signal.get("signal_type") == "sell")
+        signal_type_counts = Counter(signal.get("signal_type") for signal in filtered_signals)
         
         # Add beta and half_life statistics to summary
-        beta_values = [s.get("beta") for s in filtered_signals if s.get("beta") is not None]
-        half_life_values = [s.get("half_life") for s in filtered_signals if s.get("half_life") is not None]
+        beta_values = [beta for beta in (s.get("beta") for s in filtered_signals) if beta is not None]
+        half_life_values = [half_life for half_life in (s.get("half_life") for s in filtered_signals) if half_life is not None]
         
         beta_stats = {}
         if beta_values:
@@ -1144,20 +1734,82 @@ class PairsTradingResource(Resource):
             "signals": filtered_signals,
             "summary": {
                 "total_signals": len(filtered_signals),
-                "buy_signals": buy_count,
-                "sell_signals": sell_count,
+                "buy_signals": signal_type_counts["buy"],
+                "sell_signals": signal_type_counts["sell"],
                 "beta_stats": beta_stats,
                 "half_life_stats": half_life_stats
             }
         }
 
-class IBOVStocksResource(Resource):
-    # Cache for IBOV stocks data to avoid repeated file operations
-    _cache = {
-        'data': None,
-        'last_updated': None
-    }
+class IBOVStocksResource(MethodView):
+    # Numeric fields requests filter on by range
+    _RANGE_FIELDS = ('iv_current', 'beta_ibov', 'iv_ewma_ratio')
+    
+    # Fields results can be sorted by
+    _SORT_FIELDS = ('symbol', 'iv_current', 'beta_ibov', 'ewma_current', 'close', 'variation', 'iv_ewma_ratio')
+    
+    @classmethod
+    def _build_columns(cls, stocks_data):
+        """Lay out the fields requests filter on as NumPy columns, with missing numbers as NaN"""
+        columns = {field: _float_column([stock.get(field) for stock in stocks_data]) for field in cls._RANGE_FIELDS}
+        columns['symbol'] = np.array([stock.get('symbol') for stock in stocks_data], dtype=object)
+        columns['sort_keys'] = {field: cls._sort_column(stocks_data, field) for field in cls._SORT_FIELDS}
+        # Sort fields the file is already in ascending order of
+        columns['presorted'] = {
+            field for field, column in columns['sort_keys'].items()
+            if column is not None and (column[1:] >= column[:-1]).all()
+        }
+        return columns
+    
+    @staticmethod
+    def _sort_column(stocks_data, field):
+        """
+        Sort key column of field, with a missing value as 0 (a missing symbol as ''), or
+        None when the values aren't all plain numbers (strings for symbol) and only the
+        list sort can reproduce how they compare
+        """
+        if field == 'symbol':
+            values = [stock.get('symbol', '') for stock in stocks_data]
+            if all(type(value) is str for value in values):
+                return np.array(values, dtype=object)
+            return None
+        
+        values = [stock.get(field) for stock in stocks_data]
+        values = [0 if value is None else value for value in values]
+        if all(type(value) is float or type(value) is int for value in values):
+            column = np.array(values, dtype=np.float64)
+            if not np.isnan(column).any():
+                return column
+        return None
+
+    @staticmethod
+    @_cached_load
+    def _load(json_file_path):
+        """Read the stocks export and lay out its columns, as (stocks_data, columns)"""
+        current_app.logger.info(f"Loading IBOV stocks data from file: {json_file_path}")
+        
+        # Read the JSON file (orjson always decodes UTF-8), keeping only proper stock objects
+        stocks_data = [stock for stock in _load_json(json_file_path) if isinstance(stock, dict)]
+        
+        # Calculate iv_ewma_ratio for each stock if not already present, in one vectorized
+        # division; a missing input or a zero ewma_current leaves the ratio as None
+        pending = [stock for stock in stocks_data if 'iv_ewma_ratio' not in stock]
+        iv_current = _float_column([stock.get('iv_current') for stock in pending])
+        ewma_current = _float_column([stock.get('ewma_current') for stock in pending])
+        ratios = np.divide(iv_current, ewma_current, out=np.full_like(iv_current, np.nan), where=ewma_current != 0)
+        for stock, ratio in zip(pending, ratios.tolist()):
+            stock['iv_ewma_ratio'] = None if math.isnan(ratio) else ratio
+        
+        # NumPy columns of the fields requests filter on, aligned with stocks_data
+        return stocks_data, IBOVStocksResource._build_columns(stocks_data)
 
+    # The query parameters get() reads; its cached responses are keyed on these alone
+    _QUERY_PARAMS = ('symbol', 'min_iv_current', 'max_iv_current', 'min_beta_ibov',
+        'max_beta_ibov', 'min_iv_ewma_ratio', 'max_iv_ewma_ratio', 'sort_by', 'sort_order',
+        'limit')
+    
+    @_conditional_on_file(IBOV_STOCKS_PATH)
+    @_cached_response(IBOV_STOCKS_PATH, params=_QUERY_PARAMS)
     def get(self):
         try:
             # Get query parameters
@@ -1173,88 +1825,55 @@ class IBOVStocksResource(Resource):
             limit = request.args.get('limit', type=int)
             
             # Get the full path to the IBOV_stocks.json file
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            json_file_path = os.path.join(base_dir, "utils", "export", "IBOV_stocks.json")
+            json_file_path = IBOV_STOCKS_PATH
             
-            # Check if data is already cached and file hasn't been modified
-            file_mtime = os.path.getmtime(json_file_path)
+            # Loaded data is reused until the file changes
+            stocks_data, columns = self._load(json_file_path)
             
-            if (self._cache['data'] is None or 
-                self._cache['last_updated'] is None or 
-                self._cache['last_updated'] < file_mtime):
-                
-                current_app.logger.info(f"Loading IBOV stocks data from file: {json_file_path}")
-                
-                # Read the JSON file with explicit UTF-8 encoding
-                with open(json_file_path, 'r', encoding='utf-8') as file:
-                    stocks_data = json.load(file)
-                
-                # Calculate iv_ewma_ratio for each stock if not already present
-                for stock in stocks_data:
-                    if isinstance(stock, dict) and 'iv_ewma_ratio' not in stock:
-                        iv_current = stock.get('iv_current')
-                        ewma_current = stock.get('ewma_current')
-                        if iv_current is not None and ewma_current is not None and ewma_current != 0:
-                            stock['iv_ewma_ratio'] = iv_current / ewma_current
-                        else:
-                            stock['iv_ewma_ratio'] = None
-                
-                # Cache the data and update timestamp
-                self._cache['data'] = stocks_data
-                self._cache['last_updated'] = file_mtime
-                
-                current_app.logger.info(f"IBOV stocks data cached successfully")
-            else:
-                stocks_data = self._cache['data']
-                current_app.logger.info(f"Using cached IBOV stocks data")
-            
-            # Filter the data
-            filtered_data = []
-            for stock in stocks_data:
-                # Skip if not a proper stock object
-                if not isinstance(stock, dict):
-                    continue
-                
-                # Filter by symbol if provided
-                if symbol and stock.get('symbol') != symbol:
-                    continue
-                
-                # Filter by iv_current range if provided
-                iv_current = stock.get('iv_current')
-                if iv_current is not None:
-                    if min_iv_current is not None and iv_current < min_iv_current:
-                        continue
-                    if max_iv_current is not None and iv_current > max_iv_current:
-                        continue
-                
-                # Filter by beta_ibov range if provided
-                beta_ibov = stock.get('beta_ibov')
-                if beta_ibov is not None:
-                    if min_beta_ibov is not None and beta_ibov < min_beta_ibov:
-                        continue
-                    if max_beta_ibov is not None and beta_ibov > max_beta_ibov:
-                        continue
-                
-                # Filter by iv_ewma_ratio range if provided
-                iv_ewma_ratio = stock.get('iv_ewma_ratio')
-                if iv_ewma_ratio is not None:
-                    if min_iv_ewma_ratio is not None and iv_ewma_ratio < min_iv_ewma_ratio:
-                        continue
-                    if max_iv_ewma_ratio is not None and iv_ewma_ratio > max_iv_ewma_ratio:
-                        continue
-                
-                # If we reach here, all filters passed
-                filtered_data.append(stock)
+            # Filter the data with one boolean mask over the columns built at load
+            mask = np.ones(len(stocks_data), dtype=bool)
             
-            # Sort the filtered data
-            if sort_by in ['symbol', 'iv_current', 'beta_ibov', 'ewma_current', 'close', 'variation', 'iv_ewma_ratio']:
+            # Filter by symbol if provided
+            if symbol:
+                mask &= columns['symbol'] == symbol
+            
+            # Filter by the iv_current, beta_ibov and iv_ewma_ratio ranges if provided;
+            # a stock without the value (NaN) passes, as every comparison with NaN is false
+            for field, minimum, maximum in (
+                ('iv_current', min_iv_current, max_iv_current),
+                ('beta_ibov', min_beta_ibov, max_beta_ibov),
+                ('iv_ewma_ratio', min_iv_ewma_ratio, max_iv_ewma_ratio),
+            ):
+                if minimum is not None:
+                    mask &= ~(columns[field] < minimum)
+                if maximum is not None:
+                    mask &= ~(columns[field] > maximum)
+            
+            rows = np.flatnonzero(mask)
+            
+            # Sort the filtered rows on the key column built at load, unless the file already
+            # lists the stocks in the requested ascending order
+            sort_column = columns['sort_keys'].get(sort_by)
+            if sort_column is not None and not (sort_order != 'desc' and sort_by in columns['presorted']):
+                key = sort_column[rows]
+                if sort_column.dtype != object:
+                    order = _stable_order(-key if sort_order == 'desc' else key, limit)
+                elif sort_order == 'desc':
+                    # Descending with ties kept in their original order, as sorting with reverse=True
+                    order = len(key) - 1 - np.argsort(key[::-1], kind='stable')[::-1]
+                else:
+                    order = np.argsort(key, kind='stable')
+                rows = rows[order]
+            
+            if sort_column is None and sort_by in self._SORT_FIELDS:
+                # Sort the filtered data as a list when its values have no key column
+                filtered_data = [stocks_data[row] for row in rows.tolist()]
                 try:
-                    filtered_data.sort(
-                        key=lambda x: (
-                            x.get(sort_by, '') if sort_by == 'symbol' else 
-                            x.get(sort_by, 0) if x.get(sort_by) is not None else 0
-                        ),
-                        reverse=(sort_order == 'desc')
+                    filtered_data = _sorted_head(
+                        filtered_data,
+                        key=(lambda x: x.get(sort_by, '')) if sort_by == 'symbol' else _field_key(sort_by),
+                        reverse=(sort_order == 'desc'),
+                        limit=limit
                     )
                 except Exception as e:
                     current_app.logger.error(f"Error sorting data: {str(e)}")
@@ -1263,10 +1882,15 @@ class IBOVStocksResource(Resource):
                         key=lambda x: x.get('symbol', ''),
                         reverse=(sort_order == 'desc')
                     )
-            
-            # Apply limit if provided
-            if limit and len(filtered_data) > limit:
-                filtered_data = filtered_data[:limit]
+                
+                # Apply limit if provided
+                if limit and len(filtered_data) > limit:
+                    filtered_data = filtered_data[:limit]
+            else:
+                # Apply limit if provided, before any stock is gathered
+                if limit and len(rows) > limit:
+                    rows = rows[:limit]
+                filtered_data = [stocks_data[row] for row in rows.tolist()]
             
             # Create metadata for the response
             metadata = {
@@ -1286,24 +1910,45 @@ class IBOVStocksResource(Resource):
             }
             
             # Return the filtered and processed data
-            return make_response(jsonify({
+            return _json_response({
                 "metadata": metadata,
                 "results": filtered_data
-            }), 200)
+            }, 200)
             
         except Exception as e:
-            current_app.logger.error(f"Error in IBOVStocksResource: {str(e)}")
-            current_app.logger.error(traceback.format_exc())
-            return make_response(jsonify({'error': 'Internal Server Error', 'details': str(e)}), 500)
+            current_app.logger.exception("Error in IBOVStocksResource: %s", e)
+            return _json_response({'error': 'Internal Server Error', 'details': str(e)}, 500)
 
 
-class CumulativePerformanceResource(Resource):
-    # Cache for cumulative performance data to avoid repeated file operations
-    _cache = {
-        'data': None,
-        'last_updated': None
-    }
+class CumulativePerformanceResource(MethodView):
+    @staticmethod
+    @_cached_load
+    def _load(json_file_path):
+        """
+        Read the cumulative performance export into a DataFrame indexed by date, along
+        with its dates already formatted as strings, as (df, dates)
+        """
+        current_app.logger.info(f"Loading cumulative performance data from file: {json_file_path}")
+        
+        # Read the JSON file through a memory map with orjson
+        json_data = _load_json(json_file_path)
+        
+        # Convert JSON data to DataFrame
+        if 'data' in json_data and json_data['data']:
+            df = pd.DataFrame(json_data['data'])
+            df['date'] = pd.to_datetime(df['date'])
+            df.set_index('date', inplace=True)
+            dates = df.index.strftime('%Y-%m-%d').to_numpy(dtype=object)
+        else:
+            df = pd.DataFrame()
+            dates = np.empty(0, dtype=object)
+        return df, dates
 
+    # The query parameters get() reads; its cached responses are keyed on these alone
+    _QUERY_PARAMS = ('start_date', 'end_date', 'assets', 'normalize')
+    
+    @_conditional_on_file(CUMULATIVE_PERFORMANCE_PATH)
+    @_cached_response(CUMULATIVE_PERFORMANCE_PATH, params=_QUERY_PARAMS)
     def get(self):
         try:
             # Get query parameters
@@ -1313,54 +1958,35 @@ class CumulativePerformanceResource(Resource):
             normalize = request.args.get('normalize', 'true').lower() == 'true'  # Normalize to start at 100
             
             # Get the full path to the cumulative_performance_data.json file
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            json_file_path = os.path.join(base_dir, "utils", "export", "cumulative_performance_data.json")
+            json_file_path = CUMULATIVE_PERFORMANCE_PATH
             
             current_app.logger.info(f"Attempting to read cumulative performance data from: {json_file_path}")
             
-            # Check if data is already cached and file hasn't been modified
-            file_mtime = os.path.getmtime(json_file_path)
-            
-            if (self._cache['data'] is None or 
-                self._cache['last_updated'] is None or 
-                self._cache['last_updated'] < file_mtime):
-                
-                current_app.logger.info(f"Loading cumulative performance data from file: {json_file_path}")
-                
-                # Read the JSON file
-                with open(json_file_path, 'r') as f:
-                    json_data = json.load(f)
-                
-                # Convert JSON data to DataFrame
-                if 'data' in json_data and json_data['data']:
-                    df = pd.DataFrame(json_data['data'])
-                    df['date'] = pd.to_datetime(df['date'])
-                    df.set_index('date', inplace=True)
-                else:
-                    df = pd.DataFrame()
-                
-                # Cache the data and update timestamp
-                self._cache['data'] = df
-                self._cache['json_metadata'] = json_data.get('metadata', {})
-                self._cache['last_updated'] = file_mtime
-                
-                current_app.logger.info(f"Cumulative performance data cached successfully")
-            else:
-                df = self._cache['data']
-                current_app.logger.info(f"Using cached cumulative performance data")
+            # Loaded data is reused until the file changes
+            df, dates = self._load(json_file_path)
             
-            # Filter by date range if provided
+            # Filter by date range if provided; dates in order (as exported) are cut with a
+            # binary search into one slice instead of a full-length comparison mask
+            in_order = df.index.is_monotonic_increasing
             if start_date:
                 try:
                     start_dt = pd.to_datetime(start_date)
-                    df = df[df.index >= start_dt]
+                    if in_order:
+                        selected = slice(df.index.searchsorted(start_dt, side='left'), None)
+                    else:
+                        selected = df.index >= start_dt
+                    df, dates = df.iloc[selected], dates[selected]
                 except Exception as e:
                     current_app.logger.warning(f"Invalid start_date format: {start_date}")
             
             if end_date:
                 try:
                     end_dt = pd.to_datetime(end_date)
-                    df = df[df.index <= end_dt]
+                    if in_order:
+                        selected = slice(None, df.index.searchsorted(end_dt, side='right'))
+                    else:
+                        selected = df.index <= end_dt
+                    df, dates = df.iloc[selected], dates[selected]
                 except Exception as e:
                     current_app.logger.warning(f"Invalid end_date format: {end_date}")
             
@@ -1376,28 +2002,28 @@ class CumulativePerformanceResource(Resource):
             
             # Normalize data to start at 100 if requested
             if normalize and not df.empty:
-                # Get the first non-null value for each column as the base
-                normalized_df = df.copy()
-                for column in df.columns:
-                    first_valid_value = df[column].first_valid_index()
-                    if first_valid_value is not None:
-                        base_value = df.loc[first_valid_value, column]
-                        if base_value != 0:
-                            normalized_df[column] = (df[column] / base_value) * 100
-                df = normalized_df
+                # Get the first non-null value for each column as the base, in one pass over
+                # all columns; a column with no value or a zero base is divided by 1 and kept
+                values = df.to_numpy(dtype=np.float64, copy=True)
+                present = ~np.isnan(values)
+                base = values[present.argmax(axis=0), np.arange(values.shape[1])]
+                scaled = present.any(axis=0) & (base != 0)
+                # Scale the one copy of the values in place rather than through intermediate frames
+                values /= np.where(scaled, base, 1)
+                values *= np.where(scaled, 100, 1)
+                df = pd.DataFrame(values, index=df.index, columns=df.columns)
             
             # Prepare the response data
             data_dict = {
-                'dates': df.index.strftime('%Y-%m-%d').tolist(),
+                'dates': dates.tolist(),
                 'assets': {}
             }
-              # Add each asset's data
-            for column in df.columns:
-                # Convert NaN values to None for JSON serialization
-                column_data = df[column].tolist()
-                # Replace NaN values with None
-                column_data = [None if pd.isna(x) else x for x in column_data]
-                data_dict['assets'][column] = column_data
+            # Add each asset's data, with NaN values replaced by None for JSON serialization
+            # across the whole frame at once
+            values = df.to_numpy(dtype=object)
+            values[df.isna().to_numpy()] = None
+            for i, column in enumerate(df.columns):
+                data_dict['assets'][column] = values[:, i].tolist()
             
             # Calculate some basic statistics
             date_range = {
@@ -1409,15 +2035,25 @@ class CumulativePerformanceResource(Resource):
             # Calculate performance metrics
             performance_metrics = {}
             if not df.empty:
-                for column in df.columns:
-                    series = df[column].dropna()
-                    if not series.empty:
+                # Each statistic is taken for all columns at once, over each column's non-null values
+                counts = df.count().tolist()
+                first_values = df.bfill().iloc[0]
+                last_values = df.ffill().iloc[-1]
+                total_returns = ((last_values / first_values - 1) * 100).tolist()
+                # Returns between consecutive non-null values, as pct_change() of the dropna()'d column
+                volatilities = ((df / df.ffill().shift() - 1).std() * 100).tolist()
+                min_values = df.min().tolist()
+                max_values = df.max().tolist()
+                last_values = last_values.tolist()
+                
+                for i, column in enumerate(df.columns):
+                    if counts[i]:
                         performance_metrics[column] = {
-                            'total_return': float((series.iloc[-1] / series.iloc[0] - 1) * 100) if len(series) > 1 else 0,
-                            'volatility': float(series.pct_change().std() * 100) if len(series) > 1 else 0,
-                            'min_value': float(series.min()),
-                            'max_value': float(series.max()),
-                            'current_value': float(series.iloc[-1]) if not series.empty else None
+                            'total_return': total_returns[i] if counts[i] > 1 else 0,
+                            'volatility': volatilities[i] if counts[i] > 1 else 0,
+                            'min_value': min_values[i],
+                            'max_value': max_values[i],
+                            'current_value': last_values[i]
                         }
             
             # Create metadata
@@ -1435,17 +2071,16 @@ class CumulativePerformanceResource(Resource):
             }
             
             # Return the data
-            return make_response(jsonify({
+            return _json_response({
                 'metadata': metadata,
                 'data': data_dict
-            }), 200)
+            }, 200)
             
         except Exception as e:
-            current_app.logger.error(f"Error in CumulativePerformanceResource: {str(e)}")
-            current_app.logger.error(traceback.format_exc())
-            return make_response(jsonify({'error': 'Internal Server Error', 'details': str(e)}), 500)
+            current_app.logger.exception("Error in CumulativePerformanceResource: %s", e)
+            return _json_response({'error': 'Internal Server Error', 'details': str(e)}, 500)
 
-class FluxoDDMResource(Resource):
+class FluxoDDMResource(MethodView):
     def get(self):
         try:
             
@@ -1486,7 +2121,121 @@ class FluxoDDMResource(Resource):
             current_app.logger.error(f"Error in FluxoDDMResource: {str(e)}")
             return make_response(jsonify({'error': 'Internal Server Error', 'details': str(e)}), 500)
 
-class DividendCalendarResource(Resource):
+class DividendCalendarResource(MethodView):
+    @staticmethod
+    @_cached_load
+    def _load(json_file_path):
+        """Read the dividend calendar export into its table, None if it holds no records"""
+        current_app.logger.info(f"Reading dividend data from: {json_file_path}")
+        # orjson always decodes UTF-8, the encoding the file was read with before
+        raw_data = _load_json(json_file_path)
+        return DividendCalendarResource._build_table(raw_data) if raw_data else None
+
+    @staticmethod
+    def _build_table(raw_data):
+        """
+        Parse the payment dates and amounts of the raw records once and lay out every
+        field requests filter on or return as NumPy columns, one row per kept record
+        """
+        items = [item for item in raw_data if item.get('Pagamento')]
+
+        # Parse all payment dates in one call, memoized over the many repeated dates
+        payment_days = pd.to_datetime(
+            pd.Series([item['Pagamento'] for item in items], dtype=object),
+            format="%d/%m/%Y", errors='coerce', cache=True
+        ).to_numpy(dtype='datetime64[D]')
+
+        # pandas rejects dates it can't hold in nanoseconds too, so let strptime decide on those
+        for i in np.flatnonzero(np.isnat(payment_days)).tolist():
+            try:
+                payment_days[i] = datetime.strptime(items[i]['Pagamento'], "%d/%m/%Y")
+            except ValueError as e:
+                current_app.logger.warning(f"Invalid date format in item: {items[i]}, error: {e}")
+
+        valid = ~np.isnat(payment_days)
+        if not valid.all():
+            items = [item for item, is_valid in zip(items, valid.tolist()) if is_valid]
+            payment_days = payment_days[valid]
+
+        # Flatten the fields records are built from into columns (as shown, with their defaults)
+        columns = {
+            field: np.array([item.get(key, default) for item in items], dtype=object)
+            for field, key, default in (
+                ('pagamento', 'Pagamento', None),
+                ('codigo', 'Codigo', 'N/A'),
+                ('tipo', 'Tipo', 'N/A'),
+                ('registro', 'Registro', ''),
+                ('ex', 'Ex', ''),
+            )
+        }
+
+        # Amounts, with the display string of each formatted once here rather than per response
+        valor = np.array([_parse_brazilian_currency(item.get('Valor (R$)', '0')) for item in items], dtype=np.float64)
+        columns['valor_display'] = np.array(
+            [f'R$ {value:.6f}'.replace('.', ',') if value > 0 else 'R$ 0,000000' for value in valor.tolist()],
+            dtype=object
+        )
+
+        # Codes and types are matched case-insensitively, so they are coded by their upper-case
+        # form; a value that isn't a string keeps a code of its own that no filter matches
+        codigo_ids, codigo_labels = pd.factorize(pd.Series(
+            [item.get('Codigo', '') for item in items], dtype=object).map(_upper), use_na_sentinel=False)
+        tipo_ids, tipo_labels = pd.factorize(pd.Series(
+            [item.get('Tipo', '') for item in items], dtype=object).map(_upper), use_na_sentinel=False)
+
+        # Payment date strings and stock codes as shown, coded by distinct value for the summary counts
+        pagamento_ids, _ = pd.factorize(columns['pagamento'], use_na_sentinel=False)
+        company_ids, company_labels = pd.factorize(columns['codigo'], use_na_sentinel=False)
+        no_company = np.flatnonzero(company_labels == 'N/A')
+        # Dividend types as shown, coded for the summary breakdown
+        type_ids, type_labels = pd.factorize(columns['tipo'], use_na_sentinel=False)
+
+        # The few distinct codes and types repeat across records, so let every record share
+        # one interned copy of its value, looked up through the codes
+        for field, ids, labels in (('codigo', company_ids, company_labels), ('tipo', type_ids, type_labels)):
+            shared = np.array([sys.intern(label) if type(label) is str else label for label in labels], dtype=object)
+            columns[field] = shared[ids]
+
+        return {
+            'raw_count': len(raw_data),
+            **columns,
+            'payment_days': payment_days,
+            'payment_iso': np.datetime_as_string(payment_days.astype('datetime64[s]')).astype(object),
+            'in_payment_order': bool((payment_days[1:] >= payment_days[:-1]).all()),
+            'valor': valor,
+            'codigo_index': {label: i for i, label in enumerate(codigo_labels.tolist()) if type(label) is str},
+            'codigo_ids': codigo_ids,
+            'tipo_index': {label: i for i, label in enumerate(tipo_labels.tolist()) if type(label) is str},
+            'tipo_ids': tipo_ids,
+            'pagamento_ids': pagamento_ids,
+            'company_ids': company_ids,
+            'no_company_id': no_company[0] if len(no_company) else -1,
+            'type_ids': type_ids,
+            'type_labels': type_labels.tolist(),
+        }
+
+    # Payment status labels by status id
+    _STATUSES = ('paid', 'today', 'upcoming')
+
+    # Columns each returned record takes its values from, in the order they are gathered
+    _RECORD_FIELDS = ('pagamento', 'codigo', 'tipo', 'valor_display', 'registro', 'ex')
+
+    @staticmethod
+    def _tally(ids, size):
+        """(id, count) of every id present in ids, in order of first appearance"""
+        present, first_rows = np.unique(ids, return_index=True)
+        counts = np.bincount(ids, minlength=size)
+        return [(i, int(counts[i])) for i in present[np.argsort(first_rows)].tolist()]
+
+    @staticmethod
+    def _days_until(payment_days, now):
+        """Whole days from now until each payment, floored like (payment - now).days"""
+        days = (payment_days - np.datetime64(now.date(), 'D')).astype(np.int64)
+        # Past midnight a payment is a fraction of a day closer, which floors one day lower
+        if now.time() != datetime.min.time():
+            days -= 1
+        return days
+
     def get(self):
         """
         Get dividend calendar data directly from JSON file
@@ -1519,180 +2268,122 @@ class DividendCalendarResource(Resource):
             current_app.logger.info(f"DividendCalendar endpoint called with upcoming_days: {upcoming_days}")
             
             # Get the full path to the dividend_calender.json file
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            json_file_path = os.path.join(base_dir, "utils", "export", "dividend_calender.json")
-            
-            current_app.logger.info(f"Reading dividend data from: {json_file_path}")
+            json_file_path = DIVIDEND_CALENDAR_PATH
             
-            # Read the JSON file directly
+            # Reparse the file only when it has changed since it was cached
             try:
-                with open(json_file_path, 'r', encoding='utf-8') as file:
-                    raw_data = json.load(file)
+                table = self._load(json_file_path)
             except FileNotFoundError:
-                return make_response(jsonify({
+                return _json_response({
                     'error': 'Dividend calendar data file not found'
-                }), 404)
+                }, 404)
             except Exception as e:
-                return make_response(jsonify({
+                return _json_response({
                     'error': 'Failed to read dividend calendar data',
                     'message': str(e)
-                }), 500)
+                }, 500)
             
-            if not raw_data:
-                return make_response(jsonify({
+            if table is None:
+                return _json_response({
                     'error': 'No dividend calendar data available'
-                }), 404)
-              # Process and filter the data
-            def parse_brazilian_currency(value_str):
-                """Parse Brazilian currency format to float"""
-                if not value_str or value_str == "":
-                    return 0.0
-                
-                # Convert to string and remove R$ symbol and spaces
-                value_str = str(value_str).replace("R$", "").strip()
-                
-                # If the string is empty after cleaning, return 0
-                if not value_str:
-                    return 0.0
-                
-                try:
-                    # Handle Brazilian format with comma as decimal separator
-                    # Examples: "0,017250", "1.234,56", "1234,56"
-                    if "," in value_str:
-                        # Split by comma to separate integer and decimal parts
-                        parts = value_str.split(",")
-                        if len(parts) == 2:
-                            # Remove dots from integer part (thousand separators)
-                            integer_part = parts[0].replace(".", "")
-                            decimal_part = parts[1]
-                            # Combine with dot as decimal separator
-                            value_str = f"{integer_part}.{decimal_part}"
-                        else:
-                            # Multiple commas - invalid format
-                            return 0.0
-                    else:
-                        # No comma - check if it's a simple number or has thousand separators
-                        if value_str.count(".") > 1:
-                            # Multiple dots - thousand separators, remove all dots
-                            value_str = value_str.replace(".", "")
-                        # If single dot, assume it's decimal separator (keep as is)
-                    
-                    return float(value_str)
-                except (ValueError, AttributeError):
-                    current_app.logger.warning(f"Could not parse currency value: {value_str}")
-                    return 0.0
+                }, 404)
             
-            today = datetime.now()
-            processed_data = []
+            # Filter all records at once with boolean masks over the columns
+            mask = np.ones(len(table['pagamento']), dtype=bool)
             
-            # Create a set to track unique dates for summary
-            unique_dates = set()
+            # Apply stock code and dividend type filters; an unknown value matches no id
+            if codigo:
+                mask &= table['codigo_ids'] == table['codigo_index'].get(codigo.upper(), -1)
+            if tipo:
+                mask &= table['tipo_ids'] == table['tipo_index'].get(tipo.upper(), -1)
             
-            for item in raw_data:
-                if not item.get('Pagamento'):
-                    continue
-                
-                try:
-                    # Parse the payment date
-                    payment_date_obj = datetime.strptime(item['Pagamento'], "%d/%m/%Y")
-                    
-                    # Apply stock code filter
-                    if codigo and item.get('Codigo', '').upper() != codigo.upper():
-                        continue
-                        
-                    # Apply dividend type filter
-                    if tipo and item.get('Tipo', '').upper() != tipo.upper():
-                        continue
-                    
-                    # Parse actual dividend value for value filters
-                    valor_raw = item.get('Valor (R$)', '0')
-                    valor_float = parse_brazilian_currency(valor_raw)
-                    
-                    # Apply value filters
-                    if min_value is not None and valor_float < min_value:
-                        continue
-                    if max_value is not None and valor_float > max_value:
-                        continue
-                    
-                    # Apply date filters
-                    if payment_date and item['Pagamento'] != payment_date:
-                        continue
-                    
-                    if start_date:
-                        start_date_obj = datetime.strptime(start_date, "%d/%m/%Y")
-                        if payment_date_obj < start_date_obj:
-                            continue
-                    
-                    if end_date:
-                        end_date_obj = datetime.strptime(end_date, "%d/%m/%Y")
-                        if payment_date_obj > end_date_obj:
-                            continue
-                    
-                    # Apply upcoming days filter
-                    days_until_payment = (payment_date_obj - today).days
-                    if days_until_payment > upcoming_days:
-                        continue
-                    
-                    # Determine status
-                    if days_until_payment < 0:
-                        status = 'paid'
-                    elif days_until_payment == 0:
-                        status = 'today'
-                    else:
-                        status = 'upcoming'
-                      # Create enhanced data entry using actual JSON data
-                    enhanced_item = {
-                        'pagamento': item['Pagamento'],
-                        'codigo': item.get('Codigo', 'N/A'),
-                        'tipo': item.get('Tipo', 'N/A'),
-                        'valor': valor_float,
-                        'valor_display': f'R$ {valor_float:.6f}'.replace('.', ',') if valor_float > 0 else 'R$ 0,000000',
-                        'registro': item.get('Registro', ''),
-                        'ex': item.get('Ex', ''),
-                        'days_until_payment': days_until_payment,
-                        'status': status,
-                        'payment_date_obj': payment_date_obj.isoformat()
-                    }
-                    
-                    processed_data.append(enhanced_item)
-                    unique_dates.add(item['Pagamento'])
-                    
-                except ValueError as e:
-                    current_app.logger.warning(f"Invalid date format in item: {item}, error: {e}")
-                    continue
+            # Apply value filters; an amount that isn't a number fails neither bound
+            valor = table['valor']
+            if min_value is not None:
+                mask &= ~(valor < min_value)
+            if max_value is not None:
+                mask &= ~(valor > max_value)
             
-            # Sort the data
+            # Apply date filters
+            if payment_date:
+                mask &= table['pagamento'] == payment_date
+            
+            payment_days = table['payment_days']
+            try:
+                if start_date:
+                    mask &= payment_days >= np.datetime64(datetime.strptime(start_date, "%d/%m/%Y"), 'D')
+                if end_date:
+                    mask &= payment_days <= np.datetime64(datetime.strptime(end_date, "%d/%m/%Y"), 'D')
+            except ValueError as e:
+                # A malformed bound can't be compared against, so no record passes it
+                current_app.logger.warning(f"Invalid date filter: {e}")
+                mask[:] = False
+            
+            # Apply upcoming days filter
+            days_until = self._days_until(payment_days, datetime.now())
+            mask &= days_until <= upcoming_days
+            
+            kept = np.flatnonzero(mask)
+            
+            # Count unique dates for summary, over every record before the limit
+            unique_dates = np.unique(table['pagamento_ids'][kept]).size
+            
+            # Sort by payment date with ties in file order, skipping the sort when the file
+            # already is in that order, then apply the limit before any record is built
+            day_numbers = table['payment_days'].view(np.int64)[kept]
             if sort_order == 'desc':
-                processed_data.sort(key=lambda x: x['payment_date_obj'], reverse=True)
-            else:
-                processed_data.sort(key=lambda x: x['payment_date_obj'])
+                kept = kept[_stable_order(-day_numbers, limit)]
+            elif not table['in_payment_order']:
+                kept = kept[_stable_order(day_numbers, limit)]
             
             # Apply limit if provided
-            if limit and len(processed_data) > limit:
-                processed_data = processed_data[:limit]
+            if limit and len(kept) > limit:
+                kept = kept[:limit]
+            
+            # Determine status for all kept records at once: 0 paid, 1 today, 2 upcoming
+            kept_days = days_until[kept]
+            kept_valor = valor[kept]
+            status_ids = (kept_days >= 0).astype(np.intp) + (kept_days > 0)
+            
+            # Build records only for the kept rows, from the gathered columns
+            processed_data = []
+            for pagamento, stock_code, dividend_type, valor_display, registro, ex, valor_float, days_until_payment, status_id, payment_iso in zip(
+                    *(table[field][kept].tolist() for field in self._RECORD_FIELDS),
+                    kept_valor.tolist(), kept_days.tolist(), status_ids.tolist(), table['payment_iso'][kept].tolist()):
+                # Create enhanced data entry using actual JSON data
+                processed_data.append({
+                    'pagamento': pagamento,
+                    'codigo': stock_code,
+                    'tipo': dividend_type,
+                    'valor': valor_float,
+                    'valor_display': valor_display,
+                    'registro': registro,
+                    'ex': ex,
+                    'days_until_payment': days_until_payment,
+                    'status': self._STATUSES[status_id],
+                    'payment_date_obj': payment_iso
+                })
             
             # Create summary statistics
-            total_value = sum(item['valor'] for item in processed_data)
-            companies_count = len(set(item['codigo'] for item in processed_data if item['codigo'] != 'N/A'))
-            
-            # Group by status for summary
-            status_counts = {}
-            for item in processed_data:
-                status = item['status']
-                if status not in status_counts:
-                    status_counts[status] = 0
-                status_counts[status] += 1
-            
-            # Group by dividend type for summary
+            total_value = float(kept_valor.sum())
+            company_ids = np.unique(table['company_ids'][kept])
+            companies_count = int(np.count_nonzero(company_ids != table['no_company_id']))
+            
+            # Group by status and by dividend type for summary, tallying the category codes of
+            # the kept records in one pass each; categories are listed by first appearance
+            status_counts = {
+                self._STATUSES[status_id]: count
+                for status_id, count in self._tally(status_ids, len(self._STATUSES))
+            }
+            
+            type_ids = table['type_ids'][kept]
+            type_labels = table['type_labels']
+            type_sums = np.bincount(type_ids, weights=kept_valor, minlength=len(type_labels)).tolist()
             type_counts = {}
             type_values = {}
-            for item in processed_data:
-                tipo = item['tipo']
-                if tipo not in type_counts:
-                    type_counts[tipo] = 0
-                    type_values[tipo] = 0
-                type_counts[tipo] += 1
-                type_values[tipo] += item['valor']
+            for type_id, count in self._tally(type_ids, len(type_labels)):
+                type_counts[type_labels[type_id]] = count
+                type_values[type_labels[type_id]] = type_sums[type_id]
             
             # Prepare response
             response_data = {
@@ -1701,7 +2392,7 @@ class DividendCalendarResource(Resource):
                     'total_value': total_value,
                     'total_value_display': f'R$ {total_value:.2f}'.replace('.', ','),
                     'companies_count': companies_count,
-                    'unique_dates': len(unique_dates),
+                    'unique_dates': unique_dates,
                     'status_breakdown': status_counts,
                     'type_breakdown': {
                         'counts': type_counts,
@@ -1710,7 +2401,7 @@ class DividendCalendarResource(Resource):
                     'upcoming_days_filter': upcoming_days
                 },
                 'metadata': {
-                    'total_raw_records': len(raw_data),
+                    'total_raw_records': table['raw_count'],
                     'filtered_records': len(processed_data),
                     'filters_applied': {
                         'upcoming_days': upcoming_days,
@@ -1730,12 +2421,11 @@ class DividendCalendarResource(Resource):
             
             current_app.logger.info(f"DividendCalendar data successfully retrieved: {len(processed_data)} records")
             
-            return make_response(jsonify(response_data), 200)
+            return _json_response(response_data, 200)
             
         except Exception as e:
-            current_app.logger.error(f"Error in DividendCalendar endpoint: {str(e)}")
-            current_app.logger.error(traceback.format_exc())
-            return make_response(jsonify({
+            current_app.logger.exception("Error in DividendCalendar endpoint: %s", e)
+            return _json_response({
                 'error': 'Failed to retrieve dividend calendar data',
                 'message': str(e)
-            }), 500)
+            }, 500)
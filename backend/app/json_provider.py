@@ -0,0 +1,34 @@
+"""
+orjson-backed JSON provider for the Flask application
+Serializes jsonify() responses with orjson's C encoder instead of the stdlib json module
+"""
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+# Values may be NumPy scalars/arrays; dates still go through Flask's default so they
+# render the same. No payload is keyed by numbers any more (the volatility grid is now a
+# strikes x expiries matrix), but non-str keys are still stringified as the stdlib json
+# module did, rather than turning a stray int/None key from pandas into a 500
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that keeps Flask's behaviour but encodes with orjson"""
+
+    def _dumps_bytes(self, obj):
+        option = _ORJSON_OPTIONS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if self.compact is False or (self.compact is None and self._app.debug):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self._dumps_bytes(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dumps_bytes(obj), mimetype=self.mimetype)
@@ -1,36 +1,63 @@
 import subprocess
 from celery import shared_task
-
-@shared_task
+from celery.signals import worker_init
+
+# Utility modules whose entry points run inside the worker process. They spend
+# most of their time in pandas/NumPy and Python loops, which would hold the
+# gevent hub (and stall every other task, heartbeats and acks) on the green
+# default worker, so their tasks are routed to CPU_QUEUE, served by a prefork
+# worker (see celery_worker.py and the worker commands in server-crontabs.txt).
+IN_PROCESS_MODULES = (
+    'app.utils.all_BR_recommendations',
+    'app.utils.dividend_calender',
+    'app.utils.covered_call',
+    'app.utils.collar',
+)
+CPU_QUEUE = 'cpu'
+CPU_TASKS = (
+    'app.tasks.run_fetch_br_recommendations',
+    'app.tasks.run_fetch_agenda_dividendos',
+    'app.tasks.run_covered_call',
+    'app.tasks.run_collar',
+)
+
+
+@worker_init.connect
+def preload_task_modules(sender=None, **kwargs):
+    # Only workers consuming CPU_QUEUE run these modules. Importing them pulls in
+    # pandas, sklearn and yfinance, so it is done once at worker boot; under
+    # prefork worker_init runs in the parent, so the children inherit the imports.
+    consume_from = sender.app.amqp.queues.consume_from if sender is not None else {}
+    if CPU_QUEUE not in consume_from:
+        return
+    import importlib
+    for module_name in IN_PROCESS_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except Exception as e:
+            print(f"Error preloading {module_name}: {e}")
+
+
+@shared_task(needs_app_context=False)
 def run_fetch_br_recommendations():
     try:
-        result = subprocess.run([
-            '/var/www/next/next2/project_mvp/backend/backenv/bin/python',
-            '/var/www/next/next2/project_mvp/backend/app/utils/all_BR_recommendations.py'
-        ], capture_output=True, text=True, check=True)
-        print(result.stdout)
-        return "BR recommendations Analysis script executed successfully"
-    except subprocess.CalledProcessError as e:
+        from app.utils import all_BR_recommendations
+        return all_BR_recommendations.main()
+    except Exception as e:
         print(f"Error executing BR recommendations Analysis script: {e}")
-        print(f"Script output: {e.output}")
-        return f"Error executing BR recommendations Analysis script: {e}"
+        return {"status": "error", "error": f"Error executing BR recommendations Analysis script: {e}"}
 
 
-@shared_task
+@shared_task(needs_app_context=False)
 def run_fetch_agenda_dividendos():
     try:
-        result = subprocess.run([
-            '/var/www/next/next2/project_mvp/backend/backenv/bin/python',
-            '/var/www/next/next2/project_mvp/backend/app/utils/dividend_calender.py'
-        ], capture_output=True, text=True, check=True)
-        print(result.stdout)
-        return "Agenda Analysis script executed successfully"
-    except subprocess.CalledProcessError as e:
+        from app.utils import dividend_calender
+        return dividend_calender.fetch_and_save_dividend_data()
+    except Exception as e:
         print(f"Error executing Agenda Analysis script: {e}")
-        print(f"Script output: {e.output}")
-        return f"Error executing Agenda Analysis script: {e}"
+        return {"status": "error", "error": f"Error executing Agenda Analysis script: {e}"}
 
-@shared_task
+@shared_task(needs_app_context=False)
 def run_screener_yf():
     try:
         result = subprocess.run([
@@ -44,7 +71,7 @@ def run_screener_yf():
         print(f"Script output: {e.output}")
         return f"Error executing screener_yf Analysis script: {e}"
 
-@shared_task
+@shared_task(needs_app_context=False)
 def run_rrg_data():
     try:
         result = subprocess.run([
@@ -58,37 +85,27 @@ def run_rrg_data():
         print(f"Script output: {e.output}")
         return f"Error executing rrg_data Analysis script: {e}"
 
-@shared_task
+@shared_task(needs_app_context=False)
 def run_covered_call():
     try:
-        result = subprocess.run([
-            '/var/www/next/next2/project_mvp/backend/backenv/bin/python',
-            '/var/www/next/next2/project_mvp/backend/app/utils/covered_call.py'
-        ], capture_output=True, text=True, check=True)
-        print(result.stdout)
-        return "covered_call Analysis script executed successfully"
-    except subprocess.CalledProcessError as e:
+        from app.utils import covered_call
+        return covered_call.main()
+    except Exception as e:
         print(f"Error executing covered_call Analysis script: {e}")
-        print(f"Script output: {e.output}")
-        return f"Error executing covered_call Analysis script: {e}"
+        return {"status": "error", "error": f"Error executing covered_call Analysis script: {e}"}
 
-@shared_task
+@shared_task(needs_app_context=False)
 def run_collar():
     try:
-        result = subprocess.run([
-            '/var/www/next/next2/project_mvp/backend/backenv/bin/python',
-            '/var/www/next/next2/project_mvp/backend/app/utils/collar.py'
-        ], capture_output=True, text=True, check=True)
-        print(result.stdout)
-        return "collar Analysis script executed successfully"
-    except subprocess.CalledProcessError as e:
+        from app.utils import collar
+        return collar.main()
+    except Exception as e:
         print(f"Error executing collar Analysis script: {e}")
-        print(f"Script output: {e.output}")
-        return f"Error executing collar Analysis script: {e}"
+        return {"status": "error", "error": f"Error executing collar Analysis script: {e}"}
 
 
 
-@shared_task
+@shared_task(needs_app_context=False)
 def run_volatility_analysis():
     try:
         result = subprocess.run([
@@ -103,7 +120,7 @@ def run_volatility_analysis():
         return f"Error executing Volatility Analysis script: {e}"
 
 
-@shared_task
+@shared_task(needs_app_context=False)
 def run_cointegration_matrix():
     try:
         result = subprocess.run([
@@ -124,7 +141,7 @@ def run_cointegration_matrix():
 ###################################################################################################################################
 
 
-@shared_task
+@shared_task(needs_app_context=False)
 def run_yf_historical_90m_60m_15m_5m():
     try:
         result = subprocess.run([
@@ -138,7 +155,7 @@ def run_yf_historical_90m_60m_15m_5m():
         print(f"Script output: {e.output}")
         return f"Error executing fetch Yahoo Finance historical_90m_60m_15m_5m script: {e}"
 
-@shared_task
+@shared_task(needs_app_context=False)
 def run_yf_historical_1m():
     try:
         result = subprocess.run([
@@ -152,7 +169,7 @@ def run_yf_historical_1m():
         print(f"Script output: {e.output}")
         return f"Error executing fetch Yahoo Finance historical_1m script: {e}"
 
-@shared_task
+@shared_task(needs_app_context=False)
 def run_yf_historical_1w_1d():
     try:
         result = subprocess.run([
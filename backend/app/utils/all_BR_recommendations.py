@@ -1,11 +1,18 @@
 import sys
 import os
 import json
+import functools
 import time
+import random
+import tempfile
+import numpy as np
+import orjson
+import requests
 import pandas as pd
 import yfinance as yf
 from datetime import datetime
-from sklearn.preprocessing import MinMaxScaler
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 
 # Add this block at the beginning of the file
 if __name__ == '__main__':
@@ -16,60 +23,165 @@ else:
     from .dictionary import TICKERS_DICT
 
 tickers = TICKERS_DICT.get('TODOS', [])
+
+# Ticker info is fetched concurrently; each request is network bound, so
+# threads are enough. Failed requests (usually 429 rate limits) are retried
+# with jittered exponential backoff instead of sleeping between every ticker.
+FETCH_MAX_WORKERS = 16
+FETCH_RETRIES = 3
+FETCH_BACKOFF_SECONDS = 1.0
+
+# Per-ticker summaries are cached on disk for a short while after they were
+# fetched, so a re-run (e.g. after a crash half way through) does not hit Yahoo
+# again for tickers it already has. The TTL stays well below the 4-hourly
+# schedule, so every scheduled run still fetches current prices and targets.
+SUMMARY_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'export', 'cache')
+SUMMARY_CACHE_TTL_SECONDS = 30 * 60
+
+def _summary_cache_path(ticker):
+    return os.path.join(SUMMARY_CACHE_DIR, f"{ticker}.json")
+
+def _read_cached_summary(ticker, now):
+    path = _summary_cache_path(ticker)
+    try:
+        if now - os.path.getmtime(path) > SUMMARY_CACHE_TTL_SECONDS:
+            return None
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+def _write_cached_summary(ticker, summary):
+    try:
+        os.makedirs(SUMMARY_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=SUMMARY_CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(orjson.dumps(summary, option=orjson.OPT_SERIALIZE_NUMPY))
+        os.replace(tmp_path, _summary_cache_path(ticker))
+    except OSError as e:
+        print(f"Error caching fundamental data summary for {ticker}: {e}")
+
+def _prune_summary_cache(now):
+    """Remove cache entries older than the TTL."""
+    try:
+        names = os.listdir(SUMMARY_CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        path = os.path.join(SUMMARY_CACHE_DIR, name)
+        try:
+            if now - os.path.getmtime(path) > SUMMARY_CACHE_TTL_SECONDS:
+                os.remove(path)
+        except OSError:
+            pass
+
 def safe_get(dictionary, key, default=None):
     return dictionary.get(key, default)
 
-def analyze_ibovlist(data):
+# Per-ticker fields used by the analyze_* functions, in frame column order
+DESIRED_COLS = (
+    'currentPrice', 'targetHighPrice', 'targetLowPrice', 'targetMeanPrice',
+    'targetMedianPrice', 'recommendationMean', 'recommendationKey',
+    'numberOfAnalystOpinions', 'averageAnalystRating',
+    '% Distance to Mean', '% Distance to Median', '% Distance to Low', '% Distance to High'
+)
+# Fields that default to 0 when a ticker has no entry for them
+DISTANCE_COLS = ('% Distance to Mean', '% Distance to Median', '% Distance to Low', '% Distance to High')
+# Text fields, kept as None (not NaN) when missing
+TEXT_COLS = ['recommendationKey', 'averageAnalystRating']
+
+def _build_frame(data):
     """
-    Analyzes stocks in the Ibovespa index and ranks them by relevance.
-    
-    The analysis considers:
-    - Number of analyst opinions (more is better)
-    - % Distance to price targets (higher median and high distance is better)
-    - Recommendation strength (closer to strong buy is better)
+    Builds the analysis DataFrame (one row per ticker, 'ticker' first and then
+    DESIRED_COLS) column-wise from the {ticker: fields} mapping.
+    """
+    # dtype=object keeps the values as parsed and defers type inference to
+    # the callers (see analyze_all)
+    df = pd.DataFrame(list(data.values()), index=list(data), columns=DESIRED_COLS, dtype=object)
+    for col in DISTANCE_COLS:
+        if not all(col in stock_data for stock_data in data.values()):
+            df[col] = pd.Series([safe_get(stock_data, col, 0) for stock_data in data.values()], index=df.index, dtype=object)
+    df[TEXT_COLS] = df[TEXT_COLS].astype(object).where(df[TEXT_COLS].notna(), None)
+    return df.rename_axis('ticker').reset_index()
+
+# Columns coerced to numbers before scoring
+NUMERIC_COLS = [
+    'currentPrice', 'targetHighPrice', 'targetLowPrice', 'targetMeanPrice', 
+    'targetMedianPrice', 'recommendationMean', 'numberOfAnalystOpinions',
+    '% Distance to Mean', '% Distance to Median', '% Distance to Low', '% Distance to High'
+]
+
+# Per-analysis settings for _rank
+IBOV_RANKING = {
+    'required': ['currentPrice', 'numberOfAnalystOpinions'],
+    'positive_only': False,
+    'result_columns': [
+        'ticker', 'currentPrice', 'targetMedianPrice', 'targetHighPrice',
+        'numberOfAnalystOpinions', 'recommendationMean', 'recommendationKey',
+        '% Distance to Median', '% Distance to High', 'price_target_consensus',
+        'return_target_consensus', 'combined_score', 'relevance'
+    ],
+    'round_columns': ['recommendationMean', '% Distance to Median', '% Distance to High', 'return_target_consensus', 'combined_score'],
+}
+STRONG_BUY_RANKING = {
+    'required': ['currentPrice', 'targetMedianPrice', 'numberOfAnalystOpinions'],
+    'positive_only': True,
+    'result_columns': [
+        'ticker', 'currentPrice', 'targetMedianPrice', 'targetHighPrice',
+        'numberOfAnalystOpinions', '% Distance to Median', '% Distance to High', 'price_target_consensus', 
+        'return_target_consensus', 'combined_score', 'relevance'
+    ],
+    'round_columns': ['% Distance to Median', '% Distance to High', 'return_target_consensus', 'combined_score'],
+}
+BUY_RANKING = {
+    'required': ['currentPrice', 'targetMedianPrice', 'numberOfAnalystOpinions'],
+    'positive_only': True,
+    'result_columns': [
+        'ticker', 'currentPrice', 'targetMedianPrice', 'targetHighPrice',
+        'numberOfAnalystOpinions', 'recommendationMean',
+        '% Distance to Median', '% Distance to High', 'price_target_consensus',
+        'return_target_consensus','combined_score', 'relevance'
+    ],
+    'round_columns': ['recommendationMean', '% Distance to Median', '% Distance to High', 'return_target_consensus', 'combined_score'],
+}
+
+def _min_max_scale(values):
+    """
+    Scales each column of a float array to [0, 1], ignoring NaNs. Same
+    arithmetic as sklearn's MinMaxScaler, so results are identical, without
+    its validation overhead (or the sklearn import).
+    """
+    data_min = np.fmin.reduce(values, axis=0)
+    data_range = np.fmax.reduce(values, axis=0) - data_min
+    # Constant columns are left unscaled, i.e. mapped to 0
+    data_range[data_range < 10 * np.finfo(np.float64).eps] = 1.0
+    scale = 1.0 / data_range
+    values *= scale
+    values += 0 - data_min * scale
+    return values
+
+def _infer_numeric(df):
+    """Returns a copy of a _build_frame frame with its numeric columns' dtypes inferred."""
+    df = df.copy()
+    df[NUMERIC_COLS] = df[NUMERIC_COLS].infer_objects()
+    return df
+
+def _rank(df, required, positive_only, result_columns, round_columns):
+    """
+    Scores and ranks the stocks in df, returning the result records sorted by
+    relevance. Shared by the analyze_* functions, which only differ in which
+    stocks they pass in and in the settings above.
     """
-    tickers = TICKERS_DICT.get('IBOV', [])
-    
-    # Filter the data to include only IBOV stocks
-    ibov_data = {ticker: stock_data for ticker, stock_data in data.items() if ticker in tickers}
-    
-    # Create DataFrame with all data
-    df = pd.DataFrame([
-        {
-            'ticker': ticker,
-            'currentPrice': safe_get(stock_data, 'currentPrice'),
-            'targetHighPrice': safe_get(stock_data, 'targetHighPrice'),
-            'targetLowPrice': safe_get(stock_data, 'targetLowPrice'),
-            'targetMeanPrice': safe_get(stock_data, 'targetMeanPrice'),
-            'targetMedianPrice': safe_get(stock_data, 'targetMedianPrice'),
-            'recommendationMean': safe_get(stock_data, 'recommendationMean'),
-            'recommendationKey': safe_get(stock_data, 'recommendationKey'),
-            'numberOfAnalystOpinions': safe_get(stock_data, 'numberOfAnalystOpinions'),
-            'averageAnalystRating': safe_get(stock_data, 'averageAnalystRating'),
-            '% Distance to Mean': safe_get(stock_data, '% Distance to Mean', 0),
-            '% Distance to Median': safe_get(stock_data, '% Distance to Median', 0),
-            '% Distance to Low': safe_get(stock_data, '% Distance to Low', 0),
-            '% Distance to High': safe_get(stock_data, '% Distance to High', 0)
-        }
-        for ticker, stock_data in ibov_data.items()
-    ])
-    
     if len(df) == 0:
         return []
 
-    # Convert to numeric and handle NaNs
-    numeric_columns = [
-        'currentPrice', 'targetHighPrice', 'targetLowPrice', 'targetMeanPrice', 
-        'targetMedianPrice', 'recommendationMean', 'numberOfAnalystOpinions',
-        '% Distance to Mean', '% Distance to Median', '% Distance to Low', '% Distance to High'
-    ]
+    df = df.copy()
     
-    for col in numeric_columns:
+    # Convert to numeric and handle NaNs
+    for col in NUMERIC_COLS:
         df[col] = pd.to_numeric(df[col], errors='coerce')
-      # Drop rows with missing essential data
-    df = df.dropna(subset=[
-        'currentPrice', 'numberOfAnalystOpinions'
-    ])
+    # Drop rows with missing essential data
+    df = df.dropna(subset=required)
     
     # Filter out tickers with only one analyst (require at least 2 analysts)
     df = df[df['numberOfAnalystOpinions'] > 1]
@@ -95,6 +207,10 @@ def analyze_ibovlist(data):
     # recommendationMean is usually 1-5 where 1 is strong buy
     df['recommendation_strength'] = 5 - df['recommendationMean']
     
+    if positive_only:
+        # Filter out negative price consensus targets (expected to decrease)
+        df = df[df['return_target_consensus'] > 0]
+    
     # Save original values before normalization
     df['original_analyst_opinions'] = df['numberOfAnalystOpinions'].copy()
     df['original_return_target_consensus'] = df['return_target_consensus'].copy()
@@ -108,9 +224,8 @@ def analyze_ibovlist(data):
     
     # Use robust scaler to handle outliers
     if len(df) > 1:
-        scaler = MinMaxScaler()
-        df[columns_to_normalize] = scaler.fit_transform(
-            df[columns_to_normalize]
+        df[columns_to_normalize] = _min_max_scale(
+            df[columns_to_normalize].to_numpy(dtype=np.float64)
         )
     
     # Calculate weighted combined score
@@ -131,17 +246,10 @@ def analyze_ibovlist(data):
     sorted_tickers['return_target_consensus'] = sorted_tickers['original_return_target_consensus']
     
     # Select only the columns we want to return
-    result_columns = [
-        'ticker', 'currentPrice', 'targetMedianPrice', 'targetHighPrice',
-        'numberOfAnalystOpinions', 'recommendationMean', 'recommendationKey',
-        '% Distance to Median', '% Distance to High', 'price_target_consensus',
-        'return_target_consensus', 'combined_score', 'relevance'
-    ]
-    
     final_results = sorted_tickers[result_columns].copy()
     
     # Format numbers for better readability
-    for col in ['recommendationMean', '% Distance to Median', '% Distance to High', 'return_target_consensus', 'combined_score']:
+    for col in round_columns:
         if col in final_results.columns:
             final_results[col] = final_results[col].round(4)
     
@@ -150,137 +258,34 @@ def analyze_ibovlist(data):
     
     return result
 
-def analyze_strongbuy(data):
+def analyze_ibovlist(data):
     """
-    Analyzes stocks with 'strong_buy' recommendation and ranks them by relevance.
+    Analyzes stocks in the Ibovespa index and ranks them by relevance.
     
     The analysis considers:
     - Number of analyst opinions (more is better)
     - % Distance to price targets (higher median and high distance is better)
-    - Price momentum (if available)
-    - Trading volume (if available)
+    - Recommendation strength (closer to strong buy is better)
     """
-    # Create DataFrame with all data
-    df = pd.DataFrame([
-        {
-            'ticker': ticker,
-            'currentPrice': safe_get(stock_data, 'currentPrice'),
-            'targetHighPrice': safe_get(stock_data, 'targetHighPrice'),
-            'targetLowPrice': safe_get(stock_data, 'targetLowPrice'),
-            'targetMeanPrice': safe_get(stock_data, 'targetMeanPrice'),
-            'targetMedianPrice': safe_get(stock_data, 'targetMedianPrice'),
-            'recommendationMean': safe_get(stock_data, 'recommendationMean'),
-            'recommendationKey': safe_get(stock_data, 'recommendationKey'),
-            'numberOfAnalystOpinions': safe_get(stock_data, 'numberOfAnalystOpinions'),
-            'averageAnalystRating': safe_get(stock_data, 'averageAnalystRating'),
-            '% Distance to Mean': safe_get(stock_data, '% Distance to Mean', 0),
-            '% Distance to Median': safe_get(stock_data, '% Distance to Median', 0),
-            '% Distance to Low': safe_get(stock_data, '% Distance to Low', 0),
-            '% Distance to High': safe_get(stock_data, '% Distance to High', 0)
-        }
-        for ticker, stock_data in data.items()
-    ])
-
-    # Filter for strong buy stocks
-    strong_buy_assets = df[df['recommendationKey'] == 'strong_buy'].copy()
-    
-    if len(strong_buy_assets) == 0:
-        return []
-
-    # Convert to numeric and handle NaNs
-    numeric_columns = [
-        'currentPrice', 'targetHighPrice', 'targetLowPrice', 'targetMeanPrice', 
-        'targetMedianPrice', 'recommendationMean', 'numberOfAnalystOpinions',
-        '% Distance to Mean', '% Distance to Median', '% Distance to Low', '% Distance to High'
-    ]
-    
-    for col in numeric_columns:
-        strong_buy_assets[col] = pd.to_numeric(strong_buy_assets[col], errors='coerce')
-      # Drop rows with missing essential data
-    strong_buy_assets = strong_buy_assets.dropna(subset=[
-        'currentPrice', 'targetMedianPrice', 'numberOfAnalystOpinions'
-    ])
-    
-    # Filter out tickers with only one analyst (require at least 2 analysts)
-    strong_buy_assets = strong_buy_assets[strong_buy_assets['numberOfAnalystOpinions'] > 1]
-    
-    if len(strong_buy_assets) == 0:
-        return []
-
-    # Calculate additional metrics for scoring
-    strong_buy_assets['price_target_consensus'] = (
-        (strong_buy_assets['targetMedianPrice'] * 0.4) + 
-        (strong_buy_assets['targetHighPrice'] * 0.3) + 
-        (strong_buy_assets['targetMeanPrice'] * 0.3)
-    )
-    
-    # Calculate additional metrics for scoring
-    strong_buy_assets['return_target_consensus'] = (
-        (strong_buy_assets['% Distance to Median'] * 0.4) + 
-        (strong_buy_assets['% Distance to High'] * 0.3) + 
-        (strong_buy_assets['% Distance to Mean'] * 0.3)
-    )
-    # recommendationMean is usually 1-5 where 1 is strong buy
-    strong_buy_assets['recommendation_strength'] = 5 - strong_buy_assets['recommendationMean']
-        
-    # Filter out negative price consensus targets (expected to decrease)
-    strong_buy_assets = strong_buy_assets[strong_buy_assets['return_target_consensus'] > 0]
-    
-    # Save original values before normalization
-    strong_buy_assets['original_analyst_opinions'] = strong_buy_assets['numberOfAnalystOpinions'].copy()
-    strong_buy_assets['original_return_target_consensus'] = strong_buy_assets['return_target_consensus'].copy()
-   
-    
-    # Normalize metrics for scoring
-    columns_to_normalize = [
-        'numberOfAnalystOpinions', 
-        'return_target_consensus',
-        'recommendation_strength'
-    ]
+    tickers = TICKERS_DICT.get('IBOV', [])
     
-    # Use robust scaler to handle outliers
-    if len(strong_buy_assets) > 1:
-        scaler = MinMaxScaler()
-        strong_buy_assets[columns_to_normalize] = scaler.fit_transform(
-            strong_buy_assets[columns_to_normalize]
-        )
+    # Filter the data to include only IBOV stocks
+    ibov_data = {ticker: stock_data for ticker, stock_data in data.items() if ticker in tickers}
     
-    # Calculate weighted combined score
-    strong_buy_assets['combined_score'] = (
-        (strong_buy_assets['numberOfAnalystOpinions'] * 0.25) +
-        (strong_buy_assets['return_target_consensus'] * 0.35) +
-        (strong_buy_assets['recommendation_strength'] * 0.15)  
+    return _rank(_infer_numeric(_build_frame(ibov_data)), **IBOV_RANKING)
 
-    )
-    
-    # Sort based on combined score
-    sorted_tickers = strong_buy_assets.sort_values(by='combined_score', ascending=False)
-    
-    # Add relevance ranking
-    sorted_tickers['relevance'] = range(1, len(sorted_tickers) + 1)
-    
-    # Restore original values for the response
-    sorted_tickers['numberOfAnalystOpinions'] = sorted_tickers['original_analyst_opinions']
-    sorted_tickers['return_target_consensus'] = sorted_tickers['original_return_target_consensus']
-    
-    # Select only the columns we want to return
-    result_columns = [
-        'ticker', 'currentPrice', 'targetMedianPrice', 'targetHighPrice',
-        'numberOfAnalystOpinions', '% Distance to Median', '% Distance to High', 'price_target_consensus', 
-        'return_target_consensus', 'combined_score', 'relevance'
-    ]
-    
-    final_results = sorted_tickers[result_columns].copy()
-    
-    # Format numbers for better readability
-    for col in ['% Distance to Median', '% Distance to High', 'return_target_consensus', 'combined_score']:
-        if col in final_results.columns:
-            final_results[col] = final_results[col].round(4)
-    
-    # Convert to dictionary
-    result = final_results.to_dict(orient='records')
+def analyze_strongbuy(data):
+    """
+    Analyzes stocks with 'strong_buy' recommendation and ranks them by relevance.
     
-    return result
+    The analysis considers:
+    - Number of analyst opinions (more is better)
+    - % Distance to price targets (higher median and high distance is better)
+    - Price momentum (if available)
+    - Trading volume (if available)
+    """
+    df = _infer_numeric(_build_frame(data))
+    return _rank(df[df['recommendationKey'] == 'strong_buy'], **STRONG_BUY_RANKING)
 
 def analyze_buy(data):
     """
@@ -291,135 +296,65 @@ def analyze_buy(data):
     - % Distance to price targets (higher median and high distance is better)
     - Consensus strength (closer to strong buy is better)
     """
-    # Create DataFrame with all data
-    df = pd.DataFrame([
-        {
-            'ticker': ticker,
-            'currentPrice': safe_get(stock_data, 'currentPrice'),
-            'targetHighPrice': safe_get(stock_data, 'targetHighPrice'),
-            'targetLowPrice': safe_get(stock_data, 'targetLowPrice'),
-            'targetMeanPrice': safe_get(stock_data, 'targetMeanPrice'),
-            'targetMedianPrice': safe_get(stock_data, 'targetMedianPrice'),
-            'recommendationMean': safe_get(stock_data, 'recommendationMean'),
-            'recommendationKey': safe_get(stock_data, 'recommendationKey'),
-            'numberOfAnalystOpinions': safe_get(stock_data, 'numberOfAnalystOpinions'),
-            'averageAnalystRating': safe_get(stock_data, 'averageAnalystRating'),
-            '% Distance to Mean': safe_get(stock_data, '% Distance to Mean', 0),
-            '% Distance to Median': safe_get(stock_data, '% Distance to Median', 0),
-            '% Distance to Low': safe_get(stock_data, '% Distance to Low', 0),
-            '% Distance to High': safe_get(stock_data, '% Distance to High', 0)
-        }
-        for ticker, stock_data in data.items()
-    ])
+    df = _infer_numeric(_build_frame(data))
+    return _rank(df[df['recommendationKey'] == 'buy'], **BUY_RANKING)
 
-    # Filter for buy stocks
-    buy_assets = df[df['recommendationKey'] == 'buy'].copy()
-    
-    if len(buy_assets) == 0:
-        return []
-
-    # Convert to numeric and handle NaNs
-    numeric_columns = [
-        'currentPrice', 'targetHighPrice', 'targetLowPrice', 'targetMeanPrice', 
-        'targetMedianPrice', 'recommendationMean', 'numberOfAnalystOpinions',
-        '% Distance to Mean', '% Distance to Median', '% Distance to Low', '% Distance to High'
-    ]
-    
-    for col in numeric_columns:
-        buy_assets[col] = pd.to_numeric(buy_assets[col], errors='coerce')
-      # Drop rows with missing essential data
-    buy_assets = buy_assets.dropna(subset=[
-        'currentPrice', 'targetMedianPrice', 'numberOfAnalystOpinions'
-    ])
-    
-    # Filter out tickers with only one analyst (require at least 2 analysts)
-    buy_assets = buy_assets[buy_assets['numberOfAnalystOpinions'] > 1]
-    
-    if len(buy_assets) == 0:
-        return []
-    # Calculate additional metrics for scoring
-    buy_assets['price_target_consensus'] = (
-        (buy_assets['targetMedianPrice'] * 0.4) + 
-        (buy_assets['targetHighPrice'] * 0.3) + 
-        (buy_assets['targetMeanPrice'] * 0.3)
-    )
-    # Calculate additional metrics for scoring
-    buy_assets['return_target_consensus'] = (
-        (buy_assets['% Distance to Median'] * 0.4) + 
-        (buy_assets['% Distance to High'] * 0.3) + 
-        (buy_assets['% Distance to Mean'] * 0.3)
-    )
-    
-    
-    
-    # Add inverse of recommendation mean (lower is better, closer to strong buy)
-    # recommendationMean is usually 1-5 where 1 is strong buy
-    buy_assets['recommendation_strength'] = 5 - buy_assets['recommendationMean']
-    
-    # Filter out negative price consensus targets (expected to decrease)
-    buy_assets = buy_assets[buy_assets['return_target_consensus'] > 0]
-    
-    # Save original values before normalization
-    buy_assets['original_analyst_opinions'] = buy_assets['numberOfAnalystOpinions'].copy()
-    buy_assets['original_return_target_consensus'] = buy_assets['return_target_consensus'].copy()
-    
-    # Normalize metrics for scoring
-    columns_to_normalize = [
-        'numberOfAnalystOpinions', 
-        'return_target_consensus',
-        'recommendation_strength',
-    ]
-    
-    # Use robust scaler to handle outliers
-    if len(buy_assets) > 1:
-        scaler = MinMaxScaler()
-        buy_assets[columns_to_normalize] = scaler.fit_transform(
-            buy_assets[columns_to_normalize]
-        )
-    
-    # Calculate weighted combined score
-    buy_assets['combined_score'] = (
-        (buy_assets['numberOfAnalystOpinions'] * 0.25) +
-        (buy_assets['return_target_consensus'] * 0.35) +
-        (buy_assets['recommendation_strength'] * 0.15) 
-    )
-    
-    # Sort based on combined score
-    sorted_tickers = buy_assets.sort_values(by='combined_score', ascending=False)
-    
-    # Add relevance ranking
-    sorted_tickers['relevance'] = range(1, len(sorted_tickers) + 1)
-    
-    # Restore original values for the response
-    sorted_tickers['numberOfAnalystOpinions'] = sorted_tickers['original_analyst_opinions']
-    sorted_tickers['return_target_consensus'] = sorted_tickers['original_return_target_consensus']
+def analyze_all(data):
+    """
+    Runs the IBOV, strong buy and buy analyses over a single DataFrame built
+    once from data. Returns {'ibov': [...], 'strong_buy': [...], 'buy': [...]},
+    each list matching what the corresponding analyze_* function returns.
+    """
+    df = _build_frame(data)
     
-    # Select only the columns we want to return
-    result_columns = [
-        'ticker', 'currentPrice', 'targetMedianPrice', 'targetHighPrice',
-        'numberOfAnalystOpinions', 'recommendationMean',
-        '% Distance to Median', '% Distance to High', 'price_target_consensus',
-        'return_target_consensus','combined_score', 'relevance'
-    ]
+    # Column dtypes are inferred per analysis, as the IBOV ranking has always
+    # been computed from a frame holding only the IBOV stocks
+    ibov_df = _infer_numeric(df[df['ticker'].isin(TICKERS_DICT.get('IBOV', []))])
+    results = {'ibov': _rank(ibov_df, **IBOV_RANKING)}
     
-    final_results = sorted_tickers[result_columns].copy()
+    df = _infer_numeric(df)
+    results['strong_buy'] = _rank(df[df['recommendationKey'] == 'strong_buy'], **STRONG_BUY_RANKING)
+    results['buy'] = _rank(df[df['recommendationKey'] == 'buy'], **BUY_RANKING)
     
-    # Format numbers for better readability
-    for col in ['recommendationMean', '% Distance to Median', '% Distance to High', 'return_target_consensus', 'combined_score']:
-        if col in final_results.columns:
-            final_results[col] = final_results[col].round(4)
-    
-    # Convert to dictionary
-    result = final_results.to_dict(orient='records')
-    
-    return result
+    return results
+
+# Candidate export files, refreshed only when the export directory changes
+_recommendation_files = {'dir_mtime': None, 'files': []}
+
+def _list_recommendation_files(export_dir):
+    dir_mtime = os.stat(export_dir).st_mtime_ns
+    if _recommendation_files['dir_mtime'] != dir_mtime:
+        # all_BR_recommendations.json is the file save_all_fundamental_data_to_json
+        # keeps current; older runs wrote timestamped all_BR_recommendations_*.json files
+        _recommendation_files['files'] = [
+            f for f in os.listdir(export_dir)
+            if f.startswith('all_BR_recommendations') and f.endswith('.json')
+        ]
+        _recommendation_files['dir_mtime'] = dir_mtime
+    return _recommendation_files['files']
+
+@functools.lru_cache(maxsize=4)
+def _load_recommendations(json_file_path, version):
+    """Parses a recommendations file; version (mtime, size) keys the cache."""
+    with open(json_file_path, 'rb') as json_file:
+        raw = json_file.read()
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # json.dump writes NaN/Infinity by default, which only the stdlib parser accepts
+        return json.loads(raw)
 
 def get_recommendations_analysis(ticker=None):
+    """
+    Returns the most recent recommendations data, or {ticker: data} for a
+    single ticker. The parsed file is cached until it changes and the data
+    returned is shared between calls, so callers must not modify it.
+    """
     current_dir = os.path.dirname(os.path.abspath(__file__))
     export_dir = os.path.join(current_dir, "export")
     
     # Get the most recent file
-    files = [f for f in os.listdir(export_dir) if f.startswith('all_BR_recommendations_') and f.endswith('.json')]
+    files = _list_recommendation_files(export_dir)
     if not files:
         print("No recommendations data files found.")
         return {}
@@ -428,8 +363,8 @@ def get_recommendations_analysis(ticker=None):
     json_file_path = os.path.join(export_dir, latest_file)
     
     try:
-        with open(json_file_path, 'r', encoding='utf-8') as json_file:
-            recommendations_data = json.load(json_file)
+        stat = os.stat(json_file_path)
+        recommendations_data = _load_recommendations(json_file_path, (stat.st_mtime_ns, stat.st_size))
         
         # Return data for specific ticker if provided
         if (ticker):
@@ -443,24 +378,57 @@ def get_recommendations_analysis(ticker=None):
         print(f"Error: Invalid JSON in file {json_file_path}")
         return {}
 
+def add_sa_suffix(ticker, world=False):
+    """Yahoo Finance symbol for a ticker (B3 tickers get the .SA suffix)."""
+    return f"{ticker}.SA" if not world else ticker
+
+@functools.lru_cache(maxsize=None)
+def _yahoo_session():
+    """
+    HTTP session shared by every yf.Ticker of an export run, with a connection
+    pool large enough for all fetch threads to keep their connections alive.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=FETCH_MAX_WORKERS, pool_maxsize=FETCH_MAX_WORKERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
         
 class YData:
-    def __init__(self, ticker_symbol, interval='1d', period='2d', world=False, start_date=None, end_date=None):
+    def __init__(self, ticker_symbol, interval='1d', period='2d', world=False, start_date=None, end_date=None,
+                 symbol=None, session=None):
         self.ticker_symbol = ticker_symbol
         self.interval = interval
         self.period = period
         self.world = world
         self.start_date = start_date
         self.end_date = end_date
-        self.ticker = self._add_sa_to_tickers(self.ticker_symbol)
-        self.stock_data = yf.Ticker(self.ticker)
+        # symbol lets callers pass the Yahoo symbol they already resolved
+        self.ticker = symbol if symbol is not None else add_sa_suffix(ticker_symbol, world)
+        self.stock_data = yf.Ticker(self.ticker, session=session)
 
-    def _add_sa_to_tickers(self, tickers):
-        return f"{tickers}.SA" if not self.world else tickers
+    def _fetch_info(self):
+        for attempt in range(FETCH_RETRIES):
+            try:
+                return self.stock_data.info
+            except Exception:
+                if attempt == FETCH_RETRIES - 1:
+                    raise
+                time.sleep(FETCH_BACKOFF_SECONDS * (2 ** attempt) * (1 + random.random()))
 
     def get_fundamental_data_summary(self):
+        cached = _read_cached_summary(self.ticker, time.time())
+        if cached is not None:
+            return cached
+
+        summary = self._get_fundamental_data_summary()
+        if summary:
+            _write_cached_summary(self.ticker, summary)
+        return summary
+
+    def _get_fundamental_data_summary(self):
         try:
-            info = self.stock_data.info
+            info = self._fetch_info()
             
             # Define the specific fields we want to fetch
             desired_fields = [
@@ -469,37 +437,69 @@ class YData:
                 "numberOfAnalystOpinions", "averageAnalystRating"
             ]            
             # Create a dictionary with only the desired fields
+            # (the % Distance fields are added for all tickers at once by add_price_distances)
             filtered_info = {field: info.get(field) for field in desired_fields if field in info}
             
-            # Calculate additional metrics
-            current_price = filtered_info.get('currentPrice')
-            if current_price is not None and current_price != 0:
-                filtered_info['% Distance to Mean'] = ((filtered_info.get('targetMeanPrice', 0) - current_price) / current_price) 
-                filtered_info['% Distance to Median'] = ((filtered_info.get('targetMedianPrice', 0) - current_price) / current_price) 
-                filtered_info['% Distance to Low'] = ((filtered_info.get('targetLowPrice', 0) - current_price) / current_price) 
-                filtered_info['% Distance to High'] = ((filtered_info.get('targetHighPrice', 0) - current_price) / current_price) 
-            else:
-                filtered_info['% Distance to Mean'] = None
-                filtered_info['% Distance to Median'] = None
-                filtered_info['% Distance to Low'] = None
-                filtered_info['% Distance to High'] = None
-            
             return filtered_info
 
         except Exception as e:
             print(f"Error retrieving fundamental data summary for {self.ticker}: {e}")
             return None
 
+def _price_column(summaries, field, default=None):
+    values = pd.Series([summary.get(field, default) for summary in summaries], dtype=object)
+    return pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64)
+
+def add_price_distances(all_data):
+    """
+    Adds the '% Distance to Mean/Median/Low/High' fields, (target - current) /
+    current, to every ticker summary in all_data, computing each one as a
+    single array operation over all tickers. A missing target counts as 0;
+    without a (non-zero) current price the distances are None, while a NaN
+    one gives NaN distances, as the per-ticker arithmetic did.
+    """
+    summaries = list(all_data.values())
+    current_price = _price_column(summaries, 'currentPrice')
+    has_price = (current_price != 0) & np.array(
+        [summary.get('currentPrice') is not None for summary in summaries], dtype=bool)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        distances = [
+            ((_price_column(summaries, target_field, 0) - current_price) / current_price).tolist()
+            for target_field in ('targetMeanPrice', 'targetMedianPrice', 'targetLowPrice', 'targetHighPrice')
+        ]
+    
+    for i, (summary, valid) in enumerate(zip(summaries, has_price.tolist())):
+        for col, values in zip(DISTANCE_COLS, distances):
+            summary[col] = values[i] if valid else None
+    return all_data
+
+def _fetch_fundamental_data(ticker, symbol):
+    return YData(ticker, symbol=symbol, session=_yahoo_session()).get_fundamental_data_summary()
+
 def save_all_fundamental_data_to_json(filename):
-    all_data = {}
-    for ticker in tickers:
-        ydata = YData(ticker)
-        ticker_data = ydata.get_fundamental_data_summary()
-        if ticker_data:
-            all_data[ticker] = ticker_data
+    _prune_summary_cache(time.time())
 
-        print(f"{ticker} loaded successfully")
-        time.sleep(1)
+    results = {}
+    with ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(_fetch_fundamental_data, ticker, symbol): ticker
+            for ticker, symbol in zip(tickers, map(add_sa_suffix, tickers))
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                results[ticker] = future.result()
+            except Exception as e:
+                print(f"Error retrieving fundamental data summary for {ticker}: {e}")
+                continue
+            # A failed fetch has already reported its error and returned None
+            if results[ticker]:
+                print(f"{ticker} loaded successfully")
+
+    # Keep the export in ticker-list order regardless of completion order
+    all_data = {ticker: results[ticker] for ticker in tickers if results.get(ticker)}
+    add_price_distances(all_data)
     
     try:
         # Get the full path for the file
@@ -511,13 +511,21 @@ def save_all_fundamental_data_to_json(filename):
         filename = f'all_BR_recommendations.json'
         full_path = os.path.join(export_dir, filename)
         
-        with open(full_path, 'w', encoding='utf-8') as f:
-            json.dump(all_data, f, ensure_ascii=False, indent=4)
+        # Written to a temp file and renamed over the export, so the API never
+        # reads a half-written file
+        fd, tmp_path = tempfile.mkstemp(dir=export_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(orjson.dumps(all_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        # mkstemp creates the file owner-only; the API may run as another user
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, full_path)
         
         print(f"All Recommendations data summaries saved to {full_path}")
+        return {"status": "ok", "rows": len(all_data), "file": full_path}
     
     except Exception as e:
         print(f"Error saving all Recommendations data summaries to {full_path}: {e}")
+        return {"status": "error", "rows": len(all_data), "file": None, "error": str(e)}
 
 
 
@@ -525,8 +533,9 @@ def save_all_fundamental_data_to_json(filename):
 
 def main():
     filename = "all_BR_recommendations.json"
-    save_all_fundamental_data_to_json(filename)
+    result = save_all_fundamental_data_to_json(filename)
     print(f"Code last executed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    return result
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
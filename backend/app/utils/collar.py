@@ -6,6 +6,7 @@ import time
 import cmath
 from typing import Dict, List, Optional, Any
 from dotenv import load_dotenv
+from .oplab_token import refresh_access_token
 
 load_dotenv()
 
@@ -443,6 +444,7 @@ def save_to_json(data, current_directory):
     with open(organized_json_path, 'w', encoding='utf-8') as f:
         json.dump(organized_data, f, indent=4, ensure_ascii=False)
     print(f"Organized data saved to {organized_json_path}")
+    return {"status": "ok", "rows": len(sorted_data), "file": organized_json_path}
 
 def get_collar_analysis() -> Dict[str, List[Dict[str, Any]]]:
     # Use the export directory in the utils folder
@@ -506,6 +508,8 @@ def filter_option_fields(options):
         return {key: value for key, value in options.items() if key not in fields_to_remove}
 
 def main():
+    refresh_access_token(headers)
+    
     # Fetch underlying data
     underlying_data = fetch_underlying_data(underlying)
     
@@ -522,7 +526,7 @@ def main():
     current_directory = os.path.dirname(os.path.abspath(__file__))
     # Define the export directory
     export_directory = os.path.join(current_directory, "export")
-    save_to_json(processed_data_with_puts, export_directory)
+    return save_to_json(processed_data_with_puts, export_directory)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
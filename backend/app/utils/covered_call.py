@@ -8,6 +8,7 @@ import cmath
 import logging
 from typing import Dict, List, Optional, Any
 from dotenv import load_dotenv
+from .oplab_token import refresh_access_token
 
 load_dotenv()
 
@@ -307,7 +308,7 @@ def filter_option_fields(options):
 def save_to_json(data, current_directory, selic_rate):
     if not data:
         logger.warning("No data to save.")
-        return
+        return {"status": "empty", "rows": 0, "file": None}
 
     try:
         # Data already filtered for CDI relative return in calculate_option_metrics
@@ -338,8 +339,10 @@ def save_to_json(data, current_directory, selic_rate):
         with open(organized_json_path, 'w', encoding='utf-8') as f:
             json.dump(organized_data, f, indent=4, ensure_ascii=False)
         logger.info(f"Organized data saved to {organized_json_path}")
+        return {"status": "ok", "rows": len(filtered_data), "file": organized_json_path}
     except Exception as e:
         logger.error(f"Error saving data: {str(e)}")
+        return {"status": "error", "rows": 0, "file": None, "error": str(e)}
 
 def get_covered_call_analysis() -> Dict[str, List[Dict[str, Any]]]:
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -370,6 +373,8 @@ def get_covered_call_analysis() -> Dict[str, List[Dict[str, Any]]]:
     return covered_call_data
 
 def main():
+    refresh_access_token(headers)
+    
     logger.info("Starting covered call analysis")
     
     # Fetch SELIC rate once at the beginning
@@ -410,8 +415,9 @@ def main():
     os.makedirs(export_directory, exist_ok=True)
     
     logger.info("Saving filtered data")
-    save_to_json(covered_calls, export_directory, selic_rate)
+    result = save_to_json(covered_calls, export_directory, selic_rate)
     logger.info("Covered call analysis completed")
+    return result
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -40,7 +40,7 @@ def fetch_and_save_dividend_data():
         json.dump(data_dict, f, ensure_ascii=False, indent=4)
 
     print(f"Data successfully saved to {file_path}")
-    return file_path    
+    return {"status": "ok", "rows": len(data_dict), "file": file_path}
 
 if __name__ == "__main__":
     fetch_and_save_dividend_data()
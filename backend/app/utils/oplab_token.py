@@ -0,0 +1,25 @@
+"""
+OPLAB access token shared by the option strategy scripts
+"""
+import os
+from dotenv import dotenv_values
+
+
+def refresh_access_token(headers):
+    """
+    Re-reads OPLAB_ACCESS_TOKEN from .env into headers. The scripts stay loaded
+    in the Celery worker between runs, so this is what picks up a rotated token.
+    """
+    token = None
+    # Same lookup as load_dotenv() in a script: the nearest .env from this file upwards
+    directory = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        env_path = os.path.join(directory, '.env')
+        if os.path.isfile(env_path):
+            token = dotenv_values(env_path).get('OPLAB_ACCESS_TOKEN')
+            break
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+    headers['Access-Token'] = token or os.getenv('OPLAB_ACCESS_TOKEN')
@@ -1,4 +1,18 @@
+import sys
+
+# Green pools need the stdlib patched before anything imports socket, ssl or
+# threading, which only -P gevent / -P eventlet on the command line can do: the
+# celery CLI patches before loading this module (see server-crontabs.txt). Other
+# entry points (python celery_worker.py worker -P gevent) get the same early
+# patch here, read from the same option. Nothing is patched without a green -P,
+# and never from inside a celery CLI run, where it would come too late; keep
+# CELERY_POOL and -P in agreement.
+if 'celery.bin.celery' not in sys.modules:
+    from celery import maybe_patch_concurrency
+    maybe_patch_concurrency()
+
 from app import create_app
+from app.tasks import CPU_QUEUE, CPU_TASKS
 from celerybeat_schedule import beat_schedule
 
 # Create Flask app and get celery instance
@@ -14,7 +28,10 @@ celery_app.conf.update(
     task_serializer='json',
     accept_content=['json'],
     result_serializer='json',
+    # Exact task names take precedence over the glob: the in-process (CPU bound)
+    # tasks go to the prefork worker, everything else to the green default worker
     task_routes={
+        **{name: {'queue': CPU_QUEUE} for name in CPU_TASKS},
         'app.tasks.*': {'queue': 'default'},
     }
 )
@@ -13,6 +13,9 @@ class Config:
     API_VERSION = 'v1'
     API_PREFIX = '/api'
     
+    # Directory for the rotating API log (can point at a tmpfs-backed volume in containers)
+    LOG_DIR = os.environ.get('LOG_DIR', 'logs')
+    
     # CORS settings - list of allowed origins
     ALLOWED_ORIGINS = ['http://localhost:3000', 'https://zommaquant.com.br']
       # Celery and Redis settings
@@ -24,6 +27,33 @@ class Config:
     beat_schedule = beat_schedule
     broker_connection_retry_on_startup = True
     timezone = 'America/Sao_Paulo'  # Set timezone for beat schedule
+    # Scheduled tasks are fire-and-forget, so results are not written to Redis unless a
+    # task is declared with ignore_result=False
+    CELERY_TASK_IGNORE_RESULT = True
+    CELERY_RESULT_EXPIRES = 3600  # seconds
+    CELERY_RESULT_KEY_PREFIX = 'zq:'
+    # Import app.tasks in create_app(); tests and scripts that never enqueue work can turn this off
+    LOAD_TASKS = True
+    # Worker pool - the scheduled tasks spend their time waiting on scripts and network I/O,
+    # so green threads give far more concurrency per worker than forked processes
+    # CELERY_POOL and the worker's -P option must agree: only -P gevent/-P eventlet on the
+    # celery command line patches the stdlib early enough, setting worker_pool here does not
+    # The one default for the pool; make_celery falls back to it for configs without the key
+    CELERY_POOL = os.environ.get('CELERY_POOL', 'gevent')
+    CELERY_CONCURRENCY = int(os.environ.get('CELERY_CONCURRENCY', 100))
+    # Redis connection pooling for the broker and result backend; keep the broker pool
+    # at least as large as the worker concurrency so it never becomes the bottleneck
+    CELERY_BROKER_POOL_LIMIT = int(os.environ.get('CELERY_BROKER_POOL_LIMIT', CELERY_CONCURRENCY))
+    CELERY_REDIS_POOL_SIZE = int(os.environ.get('CELERY_REDIS_POOL_SIZE', CELERY_BROKER_POOL_LIMIT + 20))
+    CELERY_REDIS_HEALTH_CHECK_INTERVAL = 30
+    # The scheduled tasks run for minutes (the 1m history for about an hour), so each worker
+    # slot reserves only the task it is about to run instead of holding a batch an idle slot
+    # could have started. Tasks are acked when they finish, so a worker that dies mid-run
+    # hands its task back to the queue; the visibility timeout must outlast the longest task
+    # or Redis redelivers it while it is still running.
+    CELERY_PREFETCH_MULTIPLIER = int(os.environ.get('CELERY_PREFETCH_MULTIPLIER', 1))
+    CELERY_TASK_ACKS_LATE = True
+    CELERY_VISIBILITY_TIMEOUT = 6 * 3600  # seconds
       # API endpoint paths - should match frontend apiPaths in config.ts
     API_PATHS = {
         'rrg': '/rrg',
@@ -49,6 +49,28 @@ raw_env = [
 # Preload application for better performance and memory usage
 preload_app = True
 
+
+def when_ready(server):
+    """
+    With preload_app the application already lives in the master, so parse the
+    strategy exports there once. Forked workers then start with the cached data
+    (shared copy-on-write) instead of each parsing every file on its first request,
+    and workers recycled by max_requests inherit it again.
+    """
+    from flask import url_for
+
+    try:
+        app = server.app.wsgi()
+        with app.test_request_context():
+            paths = [url_for(f"api.{endpoint}") for endpoint in (
+                'collarresource', 'coveredcallresource', 'pairstradingresource', 'ibovstocksresource',
+            )]
+        client = app.test_client()
+        for path in paths:
+            client.get(path)
+    except Exception as e:
+        server.log.warning(f"Could not warm the export caches: {e}")
+
 # Enable stats if needed
 # Enable this for monitoring
 # statsd_host = 'localhost:8125' 
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""
+Tests that the NumPy helpers of all_BR_recommendations match the code they replaced
+"""
+import math
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.all_BR_recommendations import DISTANCE_COLS, _min_max_scale, add_price_distances
+
+
+def _same_float(a, b):
+    """Bit-for-bit equality of two floats, NaN and the sign of zero included"""
+    if isinstance(a, float) and isinstance(b, float):
+        if math.isnan(a) or math.isnan(b):
+            return math.isnan(a) and math.isnan(b)
+        return a == b and math.copysign(1.0, a) == math.copysign(1.0, b)
+    return a == b and type(a) is type(b)
+
+
+def _assert_same_array(actual, expected):
+    assert actual.shape == expected.shape
+    assert np.array_equal(np.isnan(actual), np.isnan(expected))
+    finite = ~np.isnan(expected)
+    assert np.array_equal(actual[finite], expected[finite])
+    assert np.array_equal(np.signbit(actual[finite]), np.signbit(expected[finite]))
+
+
+def _random_columns(rng, rows, columns):
+    values = rng.normal(scale=rng.choice([1e-3, 1.0, 1e3]), size=(rows, columns))
+    for column in range(columns):
+        kind = rng.integers(4)
+        if kind == 1:
+            values[:, column] = rng.normal()  # constant column
+        elif kind == 2:
+            values[rng.random(rows) < 0.3, column] = np.nan
+        elif kind == 3:
+            values[:, column] = np.nan
+    return values
+
+
+@pytest.mark.filterwarnings('ignore:All-NaN slice encountered')
+def test_min_max_scale_matches_min_max_scaler():
+    preprocessing = pytest.importorskip('sklearn.preprocessing')
+    rng = np.random.default_rng(0)
+
+    for _ in range(500):
+        values = _random_columns(rng, rows=int(rng.integers(2, 40)), columns=3)
+        expected = preprocessing.MinMaxScaler().fit_transform(values)
+        _assert_same_array(_min_max_scale(values.copy()), expected)
+
+
+@pytest.mark.filterwarnings('ignore:All-NaN slice encountered')
+def test_min_max_scale_edge_columns():
+    preprocessing = pytest.importorskip('sklearn.preprocessing')
+    values = np.array([
+        [1.0, 5.0, np.nan, -0.0],
+        [2.0, 5.0, np.nan, 0.0],
+        [np.nan, 5.0, np.nan, 3.0],
+    ])
+
+    scaled = _min_max_scale(values.copy())
+    _assert_same_array(scaled, preprocessing.MinMaxScaler().fit_transform(values))
+    # A constant column maps to 0, an all-NaN one stays NaN
+    assert scaled[:, 1].tolist() == [0.0, 0.0, 0.0]
+    assert np.isnan(scaled[:, 2]).all()
+
+
+def _scalar_price_distances(summary):
+    """The per-ticker arithmetic add_price_distances replaced"""
+    summary = dict(summary)
+    current_price = summary.get('currentPrice')
+    if current_price is not None and current_price != 0:
+        summary['% Distance to Mean'] = ((summary.get('targetMeanPrice', 0) - current_price) / current_price)
+        summary['% Distance to Median'] = ((summary.get('targetMedianPrice', 0) - current_price) / current_price)
+        summary['% Distance to Low'] = ((summary.get('targetLowPrice', 0) - current_price) / current_price)
+        summary['% Distance to High'] = ((summary.get('targetHighPrice', 0) - current_price) / current_price)
+    else:
+        summary['% Distance to Mean'] = None
+        summary['% Distance to Median'] = None
+        summary['% Distance to Low'] = None
+        summary['% Distance to High'] = None
+    return summary
+
+
+def _random_price(rand):
+    kind = rand.random()
+    if kind < 0.1:
+        return 0
+    if kind < 0.2:
+        return float('nan')
+    if kind < 0.3:
+        return rand.randint(1, 200)
+    return rand.uniform(0.01, 500.0)
+
+
+def _random_summary(rand):
+    summary = {'recommendationKey': 'buy'}
+    for field in ('currentPrice', 'targetMeanPrice', 'targetMedianPrice', 'targetLowPrice', 'targetHighPrice'):
+        if rand.random() < 0.8:
+            summary[field] = _random_price(rand)
+    if 'currentPrice' not in summary and rand.random() < 0.5:
+        summary['currentPrice'] = None
+    return summary
+
+
+def _assert_same_distances(all_data):
+    expected = {ticker: _scalar_price_distances(summary) for ticker, summary in all_data.items()}
+    actual = add_price_distances(all_data)
+    assert list(actual) == list(expected)
+    for ticker, summary in actual.items():
+        for col in DISTANCE_COLS:
+            assert _same_float(summary[col], expected[ticker][col]), (ticker, col, summary)
+
+
+def test_add_price_distances_matches_scalar_code():
+    rand = random.Random(0)
+    for _ in range(200):
+        all_data = {f'T{i}': _random_summary(rand) for i in range(rand.randint(0, 30))}
+        _assert_same_distances(all_data)
+
+
+def test_add_price_distances_edge_cases():
+    all_data = {
+        'MISSING_TARGETS': {'currentPrice': 10.0},
+        'ZERO_PRICE': {'currentPrice': 0, 'targetMeanPrice': 12.0},
+        'NO_PRICE': {'targetMeanPrice': 12.0},
+        'NULL_PRICE': {'currentPrice': None, 'targetMeanPrice': 12.0},
+        'NAN_PRICE': {'currentPrice': float('nan'), 'targetMeanPrice': 12.0},
+        'NAN_TARGET': {'currentPrice': 10.0, 'targetMeanPrice': float('nan')},
+        'INT_PRICES': {'currentPrice': 3, 'targetMeanPrice': 4, 'targetHighPrice': 3},
+    }
+    _assert_same_distances(all_data)
+
+    assert all_data['MISSING_TARGETS']['% Distance to Mean'] == -1.0
+    assert all_data['ZERO_PRICE']['% Distance to Mean'] is None
+    assert all_data['NULL_PRICE']['% Distance to Mean'] is None
+    assert math.isnan(all_data['NAN_PRICE']['% Distance to Mean'])
+    assert all_data['INT_PRICES']['% Distance to High'] == 0.0
@@ -0,0 +1,174 @@
+"""
+Tests for the conditional (ETag / 304) and cached responses of the export-backed API resources
+"""
+import os
+import sys
+
+import pytest
+from flask import Flask, request
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.routes import _cached_response, _conditional_on_file, _json_response
+
+
+def _is_fresh_request(args):
+    return args.get('fresh') == 'true'
+
+
+@pytest.fixture
+def export_file(tmp_path):
+    json_file_path = tmp_path / 'export.json'
+    json_file_path.write_text('{"value": 1}')
+    return str(json_file_path)
+
+
+@pytest.fixture
+def client(export_file):
+    app = Flask(__name__)
+    app.config['view_calls'] = 0
+
+    @app.route('/data')
+    @_conditional_on_file(export_file, bypass=_is_fresh_request)
+    def data():
+        app.config['view_calls'] += 1
+        return _json_response({'value': 1})
+
+    with app.test_client() as client:
+        yield client
+
+
+def _touch(json_file_path, seconds=1):
+    """Move a file's mtime forward without changing its content"""
+    file_stat = os.stat(json_file_path)
+    os.utime(json_file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def test_get_returns_etag(client):
+    response = client.get('/data')
+    assert response.status_code == 200
+    assert response.get_json() == {'value': 1}
+    assert response.headers['ETag'].startswith('W/"')
+    assert response.headers['Last-Modified']
+    assert response.cache_control.no_cache
+
+
+def test_matching_if_none_match_returns_empty_304(client):
+    etag = client.get('/data').headers['ETag']
+
+    response = client.get('/data', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+    assert response.headers['ETag'] == etag
+    # The view itself is skipped for a 304
+    assert client.application.config['view_calls'] == 1
+
+
+def test_changed_file_mtime_returns_200(client, export_file):
+    etag = client.get('/data').headers['ETag']
+    _touch(export_file)
+
+    response = client.get('/data', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json() == {'value': 1}
+    assert response.headers['ETag'] != etag
+
+
+def test_if_modified_since_returns_304(client):
+    last_modified = client.get('/data').headers['Last-Modified']
+
+    response = client.get('/data', headers={'If-Modified-Since': last_modified})
+    assert response.status_code == 304
+
+
+def test_bypassed_request_never_returns_304(client):
+    etag = client.get('/data').headers['ETag']
+
+    response = client.get('/data?fresh=true', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json() == {'value': 1}
+    assert 'ETag' not in response.headers
+
+    response = client.get('/data?fresh=true', headers={'If-None-Match': '*'})
+    assert response.status_code == 200
+
+
+def test_missing_file_is_left_to_the_view(client, export_file):
+    os.remove(export_file)
+
+    response = client.get('/data', headers={'If-None-Match': '*'})
+    assert response.status_code == 200
+    assert 'ETag' not in response.headers
+
+
+def test_pushed_app_context_does_not_pin_file_stats(client, export_file):
+    # Requests made inside an already pushed app context share its g
+    with client.application.app_context():
+        etag = client.get('/data').headers['ETag']
+        _touch(export_file)
+
+        response = client.get('/data', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+
+@pytest.fixture
+def cached_client(export_file):
+    app = Flask(__name__)
+    app.config['view_calls'] = 0
+
+    @app.route('/data')
+    @_cached_response(export_file, params=('symbol',), max_bytes=100, bypass=_is_fresh_request)
+    def data():
+        app.config['view_calls'] += 1
+        symbol = request.args.get('symbol', '')
+        # Bodies of 40 bytes, so the 100 byte budget holds two of them
+        return _json_response({'symbol': symbol.ljust(26)})
+
+    with app.test_client() as client:
+        yield client
+
+
+def test_cached_response_is_reused(cached_client):
+    first = cached_client.get('/data?symbol=PETR4')
+    second = cached_client.get('/data?symbol=PETR4')
+    assert second.data == first.data
+    assert cached_client.application.config['view_calls'] == 1
+
+
+def test_unknown_params_share_the_entry(cached_client):
+    cached_client.get('/data?symbol=PETR4')
+    cached_client.get('/data?symbol=PETR4&_=1')
+    cached_client.get('/data?_=2&symbol=PETR4&symbol=VALE3')
+    assert cached_client.application.config['view_calls'] == 1
+
+    cached_client.get('/data?symbol=VALE3')
+    assert cached_client.application.config['view_calls'] == 2
+
+
+def test_changed_file_drops_cached_responses(cached_client, export_file):
+    cached_client.get('/data?symbol=PETR4')
+    _touch(export_file)
+
+    cached_client.get('/data?symbol=PETR4')
+    assert cached_client.application.config['view_calls'] == 2
+
+
+def test_cache_is_capped_by_total_bytes(cached_client):
+    for symbol in ('PETR4', 'VALE3', 'ITUB4'):
+        assert len(cached_client.get(f'/data?symbol={symbol}').data) == 40
+    assert cached_client.application.config['view_calls'] == 3
+
+    # The oldest body was evicted to stay within 100 bytes, the two newest are kept
+    cached_client.get('/data?symbol=VALE3')
+    cached_client.get('/data?symbol=ITUB4')
+    assert cached_client.application.config['view_calls'] == 3
+    cached_client.get('/data?symbol=PETR4')
+    assert cached_client.application.config['view_calls'] == 4
+
+
+def test_bypassed_request_is_not_cached(cached_client):
+    cached_client.get('/data?symbol=PETR4&fresh=true')
+    cached_client.get('/data?symbol=PETR4&fresh=true')
+    assert cached_client.application.config['view_calls'] == 2
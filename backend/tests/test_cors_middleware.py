@@ -0,0 +1,88 @@
+"""
+Tests for the CORS middleware wrapped around the Flask app
+"""
+import os
+import sys
+
+import pytest
+from flask import Flask
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.cors_middleware import compile_origin_pattern, configure_cors
+
+ALLOWED_ORIGINS = ('http://localhost:3000', 'https://*.zommaquant.com.br')
+
+
+def _make_app(debug):
+    app = Flask(__name__)
+    app.config['ALLOWED_ORIGINS'] = ALLOWED_ORIGINS
+    app.debug = debug
+
+    @app.route('/data')
+    def data():
+        return {'value': 1}
+
+    configure_cors(app)
+    return app
+
+
+@pytest.fixture
+def debug_client():
+    with _make_app(debug=True).test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def production_client():
+    with _make_app(debug=False).test_client() as client:
+        yield client
+
+
+def test_preflight_from_allowed_origin(debug_client):
+    response = debug_client.options('/data', headers={'Origin': 'http://localhost:3000'})
+    assert response.status_code == 200
+    assert response.data == b''
+    assert response.headers['Access-Control-Allow-Origin'] == 'http://localhost:3000'
+    assert response.headers['Access-Control-Allow-Credentials'] == 'true'
+    assert 'OPTIONS' in response.headers['Access-Control-Allow-Methods']
+
+
+def test_preflight_from_disallowed_origin(debug_client):
+    response = debug_client.options('/data', headers={'Origin': 'https://evil.example.com'})
+    assert response.status_code == 200
+    # The origin is never echoed back; development falls back to the wildcard
+    assert response.headers['Access-Control-Allow-Origin'] == '*'
+
+
+def test_wildcard_origin_matches_one_subdomain_label(debug_client):
+    response = debug_client.options('/data', headers={'Origin': 'https://app.zommaquant.com.br'})
+    assert response.headers['Access-Control-Allow-Origin'] == 'https://app.zommaquant.com.br'
+
+    response = debug_client.options('/data', headers={'Origin': 'https://a.b.zommaquant.com.br'})
+    assert response.headers['Access-Control-Allow-Origin'] == '*'
+
+
+def test_debug_response_gets_cors_headers(debug_client):
+    response = debug_client.get('/data', headers={'Origin': 'http://localhost:3000'})
+    assert response.status_code == 200
+    assert response.get_json() == {'value': 1}
+    assert response.headers['Access-Control-Allow-Origin'] == 'http://localhost:3000'
+
+
+def test_production_app_adds_no_cors_headers(production_client):
+    preflight = production_client.options('/data', headers={'Origin': 'http://localhost:3000'})
+    assert preflight.status_code == 200
+    response = production_client.get('/data', headers={'Origin': 'http://localhost:3000'})
+    assert response.status_code == 200
+
+    for headers in (preflight.headers, response.headers):
+        assert not any(name.lower().startswith('access-control-') for name in headers.keys())
+
+
+def test_compile_origin_pattern_escapes_literal_characters():
+    pattern = compile_origin_pattern(('https://zommaquant.com.br',))
+    assert pattern.fullmatch('https://zommaquant.com.br')
+    assert not pattern.fullmatch('https://zommaquantXcom.br')
+    assert not pattern.fullmatch('https://zommaquant.com.br.evil.com')